@@ -26,9 +26,14 @@ axios_api.interceptors.response.use(
   async (error) => {
     const originalRequest = error.config;
 
+    // The gateway answers 401 for expired tokens; older gateways wrapped it in a 500
+    const unauthorized =
+      error.response?.status === 401 ||
+      (error.response?.status === 500 &&
+        error.response?.data?.message?.includes("401 Client Error"));
+
     if (
-      error.response?.status === 500 &&
-      error.response?.data?.message?.includes("401 Client Error") &&
+      unauthorized &&
       !originalRequest._retry &&
       !originalRequest.noAuth
     ) {
@@ -61,6 +61,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.GatewayAuthMiddleware',
 ]
 
 ROOT_URLCONF = 'api_gateway.urls'
@@ -193,7 +194,13 @@ LOGGING = {
             'class': 'api_gateway.logging_handler.CustomHTTPHandler',
             'host': env.str('LOGGING_HOST'),
             'url': env.str('LOGGING_ENDPOINT'),
+            'batch_url': env.str('LOGGING_BATCH_ENDPOINT', default='/api/logs/bulk/'),
             'method': 'POST',
+            'batch_size': env.int('LOGGING_BATCH_SIZE', default=100),
+            'flush_interval': env.float('LOGGING_FLUSH_INTERVAL', default=2),
+            'max_queue': env.int('LOGGING_MAX_QUEUE', default=10000),
+            'timeout': env.float('LOGGING_TIMEOUT', default=5),
+            'spill_path': env.str('LOGGING_SPILL_PATH', default=None),
             'formatter': 'custom',
         },
     },
@@ -216,4 +223,48 @@ AUTH_SERVICE_URL = env.str('AUTH_SERVICE_URL')
 USER_SERVICE_URL = env.str('USER_SERVICE_URL')
 SEARCH_SERVICE_URL = env.str('SEARCH_SERVICE_URL')
 INTEGRATION_SERVICE_URL = env.str('INTEGRATION_SERVICE_URL')
-LOGGING_SERVICE_URL = env.str('LOGGING_SERVICE_URL')
\ No newline at end of file
+LOGGING_SERVICE_URL = env.str('LOGGING_SERVICE_URL')
+
+# Upstream connection pools (one keep-alive pool per backend service)
+UPSTREAM_POOL_CONNECTIONS = env.int('UPSTREAM_POOL_CONNECTIONS', default=10)
+UPSTREAM_POOL_MAXSIZE = env.int('UPSTREAM_POOL_MAXSIZE', default=50)
+UPSTREAM_POOL_SIZES = {
+    'auth': env.int('UPSTREAM_POOL_SIZE_AUTH', default=UPSTREAM_POOL_MAXSIZE),
+    'user': env.int('UPSTREAM_POOL_SIZE_USER', default=UPSTREAM_POOL_MAXSIZE),
+    'search': env.int('UPSTREAM_POOL_SIZE_SEARCH', default=UPSTREAM_POOL_MAXSIZE),
+    'integration': env.int('UPSTREAM_POOL_SIZE_INTEGRATION', default=UPSTREAM_POOL_MAXSIZE),
+}
+
+# Upstream timeouts in seconds, either a single value or (connect, read)
+UPSTREAM_TIMEOUT = env.float('UPSTREAM_TIMEOUT', default=10)
+UPSTREAM_ROUTE_TIMEOUTS = {
+    'login': (2, 5),
+    'logout': (2, 5),
+    'refresh_token': (2, 5),
+    'get_preferences': (2, 5),
+    'update_preferences': (2, 5),
+    'recipe_information_bulk': (2, 20),
+    'update_user_recipes': (2, 30),
+    'update_user_ingredients': (2, 30),
+}
+
+# Expose pool utilization at /api/metrics/upstream/
+UPSTREAM_METRICS_ENABLED = env.bool('UPSTREAM_METRICS_ENABLED', default=False)
+
+# Proxy engine: bodies up to this size are buffered, larger ones are streamed
+PROXY_STREAM_THRESHOLD = env.int('PROXY_STREAM_THRESHOLD', default=256 * 1024)
+PROXY_CHUNK_SIZE = env.int('PROXY_CHUNK_SIZE', default=64 * 1024)
+
+# Async gateway mode: serve api_gateway.asgi with async views and an httpx client
+GATEWAY_ASYNC = env.bool('GATEWAY_ASYNC', default=False)
+UPSTREAM_ASYNC_MAX_CONNECTIONS = env.int('UPSTREAM_ASYNC_MAX_CONNECTIONS', default=1000)
+
+# Threads used to fan out upstream requests in sync mode
+FAN_OUT_WORKERS = env.int('FAN_OUT_WORKERS', default=16)
+
+# Edge JWT verification: verified claims kept in process, identity passed to backends in this header,
+# signed with GATEWAY_IDENTITY_SECRET (not sent when unset) and valid for GATEWAY_IDENTITY_TTL seconds
+GATEWAY_CLAIMS_CACHE_SIZE = env.int('GATEWAY_CLAIMS_CACHE_SIZE', default=10000)
+GATEWAY_IDENTITY_HEADER = env.str('GATEWAY_IDENTITY_HEADER', default='X-Gateway-User-Id')
+GATEWAY_IDENTITY_SECRET = env.str('GATEWAY_IDENTITY_SECRET', default='')
+GATEWAY_IDENTITY_TTL = env.int('GATEWAY_IDENTITY_TTL', default=60)
@@ -0,0 +1,156 @@
+"""
+Gateway throughput benchmark: sync WSGI (gunicorn) vs async ASGI (uvicorn).
+
+Starts a stub backend that answers every request after a fixed delay, points
+every *_SERVICE_URL at it, then drives the same proxied route through both
+gateway modes and reports requests/sec and latency percentiles.
+
+Run from services/api_gateway:
+    python benchmarks/gateway_throughput.py --delay 0.2 --concurrency 200 --duration 15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import httpx
+
+STUB_BODY = json.dumps({"totalResults": 1, "results": [{"id": 1, "title": "Stub Recipe"}]}).encode()
+
+
+# ASGI stub backend: sleeps for STUB_DELAY seconds, then returns a fixed JSON body
+async def stub_app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await asyncio.sleep(float(os.environ.get("STUB_DELAY", "0.1")))
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(STUB_BODY)).encode())],
+    })
+    await send({"type": "http.response.body", "body": STUB_BODY})
+
+
+def start(command, env):
+    return subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+def stop(process):
+    os.killpg(process.pid, signal.SIGTERM)
+    process.wait(timeout=10)
+
+
+def wait_until_up(url, timeout=20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up")
+
+
+# Keep `concurrency` requests in flight for `duration` seconds
+async def load(url, concurrency, duration):
+    latencies = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                start_time = time.monotonic()
+                try:
+                    response = await client.get(url)
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.monotonic() - start_time)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return latencies, errors
+
+
+def report(name, latencies, errors, duration):
+    if not latencies:
+        print(f"{name:<6} no successful requests ({errors} errors)")
+        return
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{name:<6} {len(latencies) / duration:>10.1f} req/s   p50 {p50:>8.1f} ms   p99 {p99:>8.1f} ms   errors {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--delay", type=float, default=0.1, help="stub backend delay in seconds")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--workers", type=int, default=2, help="gateway worker processes in both modes")
+    parser.add_argument("--threads", type=int, default=4, help="threads per gunicorn worker in sync mode")
+    parser.add_argument("--path", default="/api/search/recipes?query=pasta")
+    args = parser.parse_args()
+
+    stub_port, gateway_port = 8901, 8900
+    stub_url = f"http://127.0.0.1:{stub_port}"
+    gateway_url = f"http://127.0.0.1:{gateway_port}"
+
+    env = dict(os.environ)
+    env.update({
+        "STUB_DELAY": str(args.delay),
+        "SECRET_KEY": env.get("SECRET_KEY", "benchmark"),
+        "SIGNING_KEY": env.get("SIGNING_KEY", "benchmark"),
+        "ALLOWED_HOSTS": "127.0.0.1,localhost",
+        "LOGGING_HOST": f"127.0.0.1:{stub_port}",
+        "LOGGING_ENDPOINT": "/api/logs/",
+        "AUTH_SERVICE_URL": stub_url,
+        "USER_SERVICE_URL": stub_url,
+        "SEARCH_SERVICE_URL": stub_url,
+        "INTEGRATION_SERVICE_URL": stub_url,
+        "LOGGING_SERVICE_URL": stub_url,
+        "UPSTREAM_POOL_MAXSIZE": str(args.concurrency),
+    })
+
+    python = sys.executable
+    stub = start([python, "-m", "uvicorn", "benchmarks.gateway_throughput:stub_app", "--port", str(stub_port), "--log-level", "warning"], env)
+    try:
+        wait_until_up(stub_url)
+        print(f"stub delay {args.delay}s, concurrency {args.concurrency}, {args.duration}s per mode, {args.workers} workers")
+
+        modes = [
+            ("wsgi", {"GATEWAY_ASYNC": "false"}, [
+                python, "-m", "gunicorn", "api_gateway.wsgi:application", "--bind", f"127.0.0.1:{gateway_port}",
+                "--workers", str(args.workers), "--threads", str(args.threads), "--log-level", "warning",
+            ]),
+            ("asgi", {"GATEWAY_ASYNC": "true"}, [
+                python, "-m", "uvicorn", "api_gateway.asgi:application", "--port", str(gateway_port),
+                "--workers", str(args.workers), "--log-level", "warning",
+            ]),
+        ]
+
+        for name, mode_env, command in modes:
+            gateway = start(command, {**env, **mode_env})
+            try:
+                wait_until_up(gateway_url)
+                latencies, errors = asyncio.run(load(f"{gateway_url}{args.path}", args.concurrency, args.duration))
+                report(name, latencies, errors, args.duration)
+            finally:
+                stop(gateway)
+    finally:
+        stop(stub)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import asyncio
+import time
+import weakref
+import logging
+import httpx
+from django.conf import settings
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+
+class AsyncUpstreamClient:
+    # Initialize the client with the backend services and pool / timeout settings
+    def __init__(self, services, max_connections=1000, pool_maxsize=50, pool_sizes=None, default_timeout=10, route_timeouts=None):
+        self.services = services
+        self.max_connections = max_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_sizes = pool_sizes or {}
+        self.default_timeout = default_timeout
+        self.route_timeouts = route_timeouts or {}
+
+        # httpx clients are bound to the event loop that opened their connections
+        self._clients = weakref.WeakKeyDictionary()
+        self._stats = {
+            name: {"requests": 0, "errors": 0, "in_flight": 0, "total_time": 0.0}
+            for name in services
+        }
+
+    # One keep-alive client per backend service and event loop, created on first use
+    def client(self, service):
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(service)
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.pool_sizes.get(service, self.pool_maxsize),
+            )
+            client = httpx.AsyncClient(base_url=self.services[service], limits=limits)
+            clients[service] = client
+        return client
+
+    # Timeout for a route, falling back to the default timeout
+    def timeout_for(self, route):
+        timeout = self.route_timeouts.get(route, self.default_timeout)
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    # Send a request to a backend service; the caller must close streamed responses
+    async def request(self, service, method, path, route=None, stream=False, **kwargs):
+        if service not in self.services:
+            raise ValueError(f"Unknown upstream service: {service}")
+
+        client = self.client(service)
+        kwargs.setdefault("timeout", self.timeout_for(route))
+        stats = self._stats[service]
+
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        start = time.monotonic()
+        try:
+            upstream_request = client.build_request(method, path, **kwargs)
+            return await client.send(upstream_request, stream=stream)
+        except httpx.HTTPError:
+            stats["errors"] += 1
+            raise
+        finally:
+            stats["in_flight"] -= 1
+            stats["total_time"] += time.monotonic() - start
+
+    # Run several upstream requests concurrently and return them in order
+    async def gather(self, *calls):
+        return await asyncio.gather(*(self.request(*args, **kwargs) for args, kwargs in calls), return_exceptions=True)
+
+    # Request counters for every service
+    def metrics(self):
+        metrics = {}
+        for service, stats in self._stats.items():
+            requests_made = stats["requests"]
+            metrics[service] = {
+                "requests": requests_made,
+                "errors": stats["errors"],
+                "in_flight": stats["in_flight"],
+                "avg_latency_ms": round(stats["total_time"] / requests_made * 1000, 2) if requests_made else 0.0,
+                "pool_maxsize": self.pool_sizes.get(service, self.pool_maxsize),
+                "max_connections": self.max_connections,
+            }
+        return metrics
+
+
+# Shared client used by the async gateway views
+async_upstream = AsyncUpstreamClient(
+    services={
+        "auth": settings.AUTH_SERVICE_URL,
+        "user": settings.USER_SERVICE_URL,
+        "search": settings.SEARCH_SERVICE_URL,
+        "integration": settings.INTEGRATION_SERVICE_URL,
+    },
+    max_connections=settings.UPSTREAM_ASYNC_MAX_CONNECTIONS,
+    pool_maxsize=settings.UPSTREAM_POOL_MAXSIZE,
+    pool_sizes=settings.UPSTREAM_POOL_SIZES,
+    default_timeout=settings.UPSTREAM_TIMEOUT,
+    route_timeouts=settings.UPSTREAM_ROUTE_TIMEOUTS,
+)
@@ -0,0 +1,80 @@
+import hmac
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+import jwt
+from django.conf import settings
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+
+class InvalidToken(Exception):
+    pass
+
+
+class ClaimsCache:
+    # Verified claims by token hash, kept until the token expires or is evicted
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is None:
+                return None
+            if claims["exp"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def set(self, key, claims):
+        with self._lock:
+            self._entries[key] = claims
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+claims_cache = ClaimsCache(settings.GATEWAY_CLAIMS_CACHE_SIZE)
+
+
+# Verify an access token with the SIMPLE_JWT signing key shared with the backend services
+def verify_token(token):
+    key = hashlib.sha256(token.encode()).hexdigest()
+    claims = claims_cache.get(key)
+    if claims is not None:
+        return claims
+
+    try:
+        claims = jwt.decode(
+            token,
+            settings.SIMPLE_JWT['SIGNING_KEY'],
+            algorithms=[settings.SIMPLE_JWT.get('ALGORITHM', 'HS256')],
+            options={"require": ["exp", "token_type"]},
+        )
+    except jwt.ExpiredSignatureError:
+        raise InvalidToken("Token has expired")
+    except jwt.InvalidTokenError as e:
+        logger.error(f"Invalid token: {str(e)}")
+        raise InvalidToken("Token is invalid")
+
+    # Refresh tokens are only accepted by the refresh endpoint, not as bearer tokens
+    if claims["token_type"] != "access":
+        raise InvalidToken("Token has wrong type")
+
+    claims_cache.set(key, claims)
+    return claims
+
+
+# Identity header value "user_id:exp:signature", an HMAC the backends verify with the shared GATEWAY_IDENTITY_SECRET
+# so a request sent straight to a backend port can't claim a user id
+def sign_identity(user_id):
+    payload = f"{user_id}:{int(time.time()) + settings.GATEWAY_IDENTITY_TTL}"
+    signature = hmac.new(settings.GATEWAY_IDENTITY_SECRET.encode(), payload.encode(), hashlib.sha256).hexdigest()
+    return f"{payload}:{signature}"
@@ -0,0 +1,301 @@
+import json
+import httpx
+import requests
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import path
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+# Upstream Clients
+from .upstream import upstream
+from .async_upstream import async_upstream
+from .jwt_auth import sign_identity
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+# Headers passed through in each direction
+FORWARD_REQUEST_HEADERS = ("Content-Type", "If-None-Match", "If-Match")
+
+# Upstream statuses clients act on (409 version conflicts carry the current version), passed through
+# with their body even on raise_errors routes
+PASS_THROUGH_STATUSES = (409,)
+FORWARD_RESPONSE_HEADERS = ("ETag", "Cache-Control", "Last-Modified")
+
+# Threads used by the sync fan-out view
+fan_out_executor = ThreadPoolExecutor(max_workers=settings.FAN_OUT_WORKERS)
+
+
+class ProxyView(View):
+    # Route settings, filled in per route by route()
+    route = None
+    service = None
+    upstream_path = None
+    methods = ("GET",)
+    auth = "none"
+    raise_errors = False
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Bodies are forwarded untouched, so CSRF is left to the backend services like DRF did
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in self.methods:
+            return self.http_method_not_allowed(request, *args, **kwargs)
+        return self.proxy(request, **kwargs)
+
+    # Authorization (verified once in GatewayAuthMiddleware)
+    def check_auth(self, request):
+        if self.auth == "none":
+            return None
+
+        # Optional routes still reject a token that was sent but failed verification
+        if request.gateway_token is None and (self.auth == "required" or request.gateway_token_rejected):
+            logger.error(f"{request.gateway_auth_error} for {self.route}")
+            return JsonResponse({"message": request.gateway_auth_error}, status=401)
+        return None
+
+    # Upstream path with path parameters and the raw query string
+    def build_path(self, request, upstream_path, kwargs):
+        upstream_path = upstream_path.format(**kwargs)
+        query_string = request.META.get("QUERY_STRING")
+        if query_string:
+            upstream_path = f"{upstream_path}?{query_string}"
+        return upstream_path
+
+    # Build the headers sent to the backend service
+    def upstream_headers(self, request):
+        headers = {"Content-Type": "application/json"}
+        for name in FORWARD_REQUEST_HEADERS:
+            value = request.headers.get(name)
+            if value:
+                headers[name] = value
+
+        # Only the gateway sets the identity header, client headers are never copied through
+        if self.auth != "none" and request.gateway_token is not None:
+            headers["Authorization"] = f"Bearer {request.gateway_token}"
+            if settings.GATEWAY_IDENTITY_SECRET:
+                headers[settings.GATEWAY_IDENTITY_HEADER] = sign_identity(request.gateway_claims["user_id"])
+        return headers
+
+    def proxy(self, request, **kwargs):
+        denied = self.check_auth(request)
+        if denied is not None:
+            return denied
+
+        try:
+            response = upstream.request(
+                self.service,
+                request.method,
+                self.build_path(request, self.upstream_path, kwargs),
+                route=self.route,
+                data=request.body or None,
+                headers=self.upstream_headers(request),
+                stream=True,
+            )
+
+            # Routes that used raise_for_status() keep reporting upstream errors as a 500 (401s as a 401)
+            if self.raise_errors and response.status_code not in PASS_THROUGH_STATUSES:
+                try:
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError:
+                    response.close()
+                    raise
+
+        # Exception Handling
+        except requests.exceptions.RequestException as e:
+            logger.error(f"RequestException: {str(e)}")
+            return JsonResponse({"message": str(e)}, status=error_status(getattr(e.response, "status_code", None)))
+
+        # LOGGER: Test response data
+        logger.info(f"Response from {self.service} service for {self.route}: {response.status_code}")
+
+        # Pass the upstream body through without decoding it
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and int(content_length) <= settings.PROXY_STREAM_THRESHOLD:
+            body = response.content
+            response.close()
+        else:
+            body = stream_body(response)
+        return build_response(response, body)
+
+
+class AsyncProxyView(ProxyView):
+    # Async handlers mark the view as async for Django; dispatch() still routes through proxy()
+    async def get(self, request, **kwargs):
+        return await self.proxy(request, **kwargs)
+
+    post = put = delete = get
+
+    async def proxy(self, request, **kwargs):
+        denied = self.check_auth(request)
+        if denied is not None:
+            return denied
+
+        try:
+            response = await async_upstream.request(
+                self.service,
+                request.method,
+                self.build_path(request, self.upstream_path, kwargs),
+                route=self.route,
+                content=request.body or None,
+                headers=self.upstream_headers(request),
+                stream=True,
+            )
+
+        # Exception Handling
+        except httpx.HTTPError as e:
+            logger.error(f"HTTPError: {str(e)}")
+            return JsonResponse({"message": str(e)}, status=500)
+
+        # Routes that used raise_for_status() keep reporting upstream errors as a 500 (401s as a 401)
+        if self.raise_errors and response.status_code >= 400 and response.status_code not in PASS_THROUGH_STATUSES:
+            await response.aclose()
+            message = upstream_error_message(response.status_code, response.reason_phrase, response.url)
+            logger.error(f"RequestException: {message}")
+            return JsonResponse({"message": message}, status=error_status(response.status_code))
+
+        # LOGGER: Test response data
+        logger.info(f"Response from {self.service} service for {self.route}: {response.status_code}")
+
+        # Pass the upstream body through without decoding it
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and int(content_length) <= settings.PROXY_STREAM_THRESHOLD:
+            body = await response.aread()
+            await response.aclose()
+        else:
+            body = async_stream_body(response)
+        return build_response(response, body)
+
+
+class FanOutView(ProxyView):
+    # (service, upstream_path) pairs requested together, filled in by fan_out()
+    parts = ()
+
+    def proxy(self, request, **kwargs):
+        denied = self.check_auth(request)
+        if denied is not None:
+            return denied
+
+        headers = self.upstream_headers(request)
+        futures = [
+            fan_out_executor.submit(
+                upstream.get, service, self.build_path(request, upstream_path, kwargs), route=self.route, headers=headers
+            )
+            for service, upstream_path in self.parts
+        ]
+
+        try:
+            responses = [future.result() for future in futures]
+            for response in responses:
+                response.raise_for_status()
+
+        # Exception Handling
+        except requests.exceptions.RequestException as e:
+            logger.error(f"RequestException: {str(e)}")
+            return JsonResponse({"message": str(e)}, status=error_status(getattr(e.response, "status_code", None)))
+
+        return JsonResponse(merge_parts(response.content for response in responses))
+
+
+class AsyncFanOutView(FanOutView):
+    async def get(self, request, **kwargs):
+        return await self.proxy(request, **kwargs)
+
+    async def proxy(self, request, **kwargs):
+        denied = self.check_auth(request)
+        if denied is not None:
+            return denied
+
+        # All parts are in flight at once on the event loop
+        headers = self.upstream_headers(request)
+        responses = await async_upstream.gather(*(
+            ((service, "GET", self.build_path(request, upstream_path, kwargs)), {"route": self.route, "headers": headers})
+            for service, upstream_path in self.parts
+        ))
+
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error(f"HTTPError: {str(response)}")
+                return JsonResponse({"message": str(response)}, status=500)
+            if response.status_code >= 400:
+                message = upstream_error_message(response.status_code, response.reason_phrase, response.url)
+                logger.error(f"RequestException: {message}")
+                return JsonResponse({"message": message}, status=error_status(response.status_code))
+
+        return JsonResponse(merge_parts(response.content for response in responses))
+
+
+# Same wording as requests' raise_for_status(), which the frontend matches on
+def upstream_error_message(status_code, reason, url):
+    kind = "Client" if status_code < 500 else "Server"
+    return f"{status_code} {kind} Error: {reason} for url: {url}"
+
+
+# Upstream 401s stay 401s so clients can refresh their token, other errors keep the old 500
+def error_status(status_code):
+    return 401 if status_code == 401 else 500
+
+
+# Merge the JSON objects returned by each fan-out part
+def merge_parts(bodies):
+    merged = {}
+    for body in bodies:
+        merged.update(json.loads(body))
+    return merged
+
+
+# Copy the upstream status, content type and cache headers onto the gateway response
+def build_response(response, body):
+    content_type = response.headers.get("Content-Type", "application/json")
+    if isinstance(body, bytes):
+        proxied = HttpResponse(body, status=response.status_code, content_type=content_type)
+    else:
+        proxied = StreamingHttpResponse(body, status=response.status_code, content_type=content_type)
+
+    for name in FORWARD_RESPONSE_HEADERS:
+        if name in response.headers:
+            proxied[name] = response.headers[name]
+    return proxied
+
+
+# Stream the upstream body and release the pooled connection when done
+def stream_body(response):
+    try:
+        for chunk in response.iter_content(chunk_size=settings.PROXY_CHUNK_SIZE):
+            yield chunk
+    finally:
+        response.close()
+
+
+async def async_stream_body(response):
+    try:
+        async for chunk in response.aiter_bytes(chunk_size=settings.PROXY_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+# Declare a proxied route for core/urls.py
+def route(pattern, name, service, upstream_path, methods=("GET",), auth="none", raise_errors=False):
+    view_class = AsyncProxyView if settings.GATEWAY_ASYNC else ProxyView
+    view = view_class.as_view(
+        route=name,
+        service=service,
+        upstream_path=upstream_path,
+        methods=tuple(methods),
+        auth=auth,
+        raise_errors=raise_errors,
+    )
+    return path(pattern, view, name=name)
+
+
+# Declare a route that requests several GET endpoints concurrently and merges their JSON objects
+def fan_out(pattern, name, parts, auth="none"):
+    view_class = AsyncFanOutView if settings.GATEWAY_ASYNC else FanOutView
+    view = view_class.as_view(route=name, parts=tuple(parts), auth=auth)
+    return path(pattern, view, name=name)
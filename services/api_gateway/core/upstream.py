@@ -0,0 +1,140 @@
+import threading
+import time
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+
+class UpstreamClient:
+    # Initialize the client with the backend services and pool / timeout settings
+    def __init__(self, services, pool_connections=10, pool_maxsize=50, pool_sizes=None, default_timeout=10, route_timeouts=None):
+        self.services = services
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_sizes = pool_sizes or {}
+        self.default_timeout = default_timeout
+        self.route_timeouts = route_timeouts or {}
+
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            name: {"requests": 0, "errors": 0, "in_flight": 0, "total_time": 0.0}
+            for name in services
+        }
+
+    # One keep-alive session per backend service, created on first use
+    def session(self, service):
+        session = self._sessions.get(service)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(service)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_sizes.get(service, self.pool_maxsize),
+                    pool_block=False,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[service] = session
+        return session
+
+    # Timeout for a route, falling back to the default timeout
+    def timeout_for(self, route):
+        timeout = self.route_timeouts.get(route, self.default_timeout)
+        return tuple(timeout) if isinstance(timeout, list) else timeout
+
+    # Send a request to a backend service through its pooled session
+    def request(self, service, method, path, route=None, **kwargs):
+        if service not in self.services:
+            raise ValueError(f"Unknown upstream service: {service}")
+
+        kwargs.setdefault("timeout", self.timeout_for(route))
+        url = f"{self.services[service]}{path}"
+        stats = self._stats[service]
+
+        with self._lock:
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+        start = time.monotonic()
+        try:
+            return self.session(service).request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                stats["in_flight"] -= 1
+                stats["total_time"] += time.monotonic() - start
+
+    def get(self, service, path, **kwargs):
+        return self.request(service, "GET", path, **kwargs)
+
+    def post(self, service, path, **kwargs):
+        return self.request(service, "POST", path, **kwargs)
+
+    def put(self, service, path, **kwargs):
+        return self.request(service, "PUT", path, **kwargs)
+
+    def delete(self, service, path, **kwargs):
+        return self.request(service, "DELETE", path, **kwargs)
+
+    # Pool utilization and request counters for every service
+    def metrics(self):
+        metrics = {}
+        for service in self.services:
+            with self._lock:
+                stats = dict(self._stats[service])
+
+            pools = []
+            session = self._sessions.get(service)
+            if session is not None:
+                pool_manager = session.get_adapter(self.services[service]).poolmanager
+                for key in pool_manager.pools.keys():
+                    pool = pool_manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    idle = pool.pool.qsize() if pool.pool is not None else 0
+                    pools.append({
+                        "host": pool.host,
+                        "port": pool.port,
+                        "maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+                        "idle_connections": idle,
+                        "connections_created": pool.num_connections,
+                        "requests_served": pool.num_requests,
+                    })
+
+            requests_made = stats["requests"]
+            metrics[service] = {
+                "requests": requests_made,
+                "errors": stats["errors"],
+                "in_flight": stats["in_flight"],
+                "avg_latency_ms": round(stats["total_time"] / requests_made * 1000, 2) if requests_made else 0.0,
+                "pool_maxsize": self.pool_sizes.get(service, self.pool_maxsize),
+                "pools": pools,
+            }
+        return metrics
+
+
+# Shared client used by every gateway view
+upstream = UpstreamClient(
+    services={
+        "auth": settings.AUTH_SERVICE_URL,
+        "user": settings.USER_SERVICE_URL,
+        "search": settings.SEARCH_SERVICE_URL,
+        "integration": settings.INTEGRATION_SERVICE_URL,
+    },
+    pool_connections=settings.UPSTREAM_POOL_CONNECTIONS,
+    pool_maxsize=settings.UPSTREAM_POOL_MAXSIZE,
+    pool_sizes=settings.UPSTREAM_POOL_SIZES,
+    default_timeout=settings.UPSTREAM_TIMEOUT,
+    route_timeouts=settings.UPSTREAM_ROUTE_TIMEOUTS,
+)
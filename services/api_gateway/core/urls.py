@@ -1,32 +1,40 @@
 from django.urls import path
-from .views import RegisterUserView, UnregisterUserView, LoginUserView, LogoutUserView, GetPreferencesView, UpdatePreferencesView, GetRecipeInformationView, GetIngredientInformationView, SearchRecipesView, SearchIngredientsView, RefreshTokenView, UserRecipesView, UserIngredientsView, UpdateUserRecipesView, UpdateUserIngredientsView
+from .proxy import route, fan_out
+from .views import UpstreamMetricsView
 
+# Route table: gateway path -> backend service and path
 urlpatterns = [
     # Basic User Registration and Authentication
-    path('register/', RegisterUserView.as_view(), name='register'),
-    path('unregister/', UnregisterUserView.as_view(), name='unregister'),
-    path('login/', LoginUserView.as_view(), name='login'),
-    path('logout/', LogoutUserView.as_view(), name='logout'),
-    path('refresh_token/', RefreshTokenView.as_view(), name='refresh_token'),
+    route('register/', 'register', 'auth', '/api/register/', methods=['POST']),
+    route('unregister/', 'unregister', 'auth', '/api/unregister/', methods=['POST']),
+    route('login/', 'login', 'auth', '/api/login/', methods=['POST']),
+    route('logout/', 'logout', 'auth', '/api/logout/', methods=['POST'], auth='required'),
+    route('refresh_token/', 'refresh_token', 'auth', '/api/refresh_token/', methods=['POST']),
 
     # User Preferences
-    path('preferences/', GetPreferencesView.as_view(), name='get_preferences'),
-    path('preferences/update/', UpdatePreferencesView.as_view(), name='update_preferences'),
+    route('preferences/', 'get_preferences', 'user', '/api/preferences/', auth='required', raise_errors=True),
+    route('preferences/update/', 'update_preferences', 'user', '/api/preferences/', methods=['PUT'], auth='required', raise_errors=True),
 
     # Recipe and Ingredient Information
-    path('recipes/<int:recipe_id>/', GetRecipeInformationView.as_view(), name='recipe_information'),
-    path('ingredients/<int:ingredient_id>/', GetIngredientInformationView.as_view(), name='ingredient_information'),
+    route('recipes/bulk/', 'recipe_information_bulk', 'integration', '/api/recipes/bulk/', raise_errors=True),
+    route('recipes/<int:recipe_id>/', 'recipe_information', 'integration', '/api/recipes/{recipe_id}/', raise_errors=True),
+    route('ingredients/<int:ingredient_id>/', 'ingredient_information', 'integration', '/api/ingredients/{ingredient_id}/', raise_errors=True),
 
     # Search Recipes and Ingredients
-    path('search/recipes', SearchRecipesView.as_view(), name='search_recipes'),
-    path('search/ingredients', SearchIngredientsView.as_view(), name='search_ingredients'),
+    route('search/recipes', 'search_recipes', 'search', '/api/search/recipes/', auth='optional', raise_errors=True),
+    route('search/ingredients', 'search_ingredients', 'search', '/api/search/ingredients/', auth='optional', raise_errors=True),
 
     # User Recipes and Ingredients
-    path('user/recipes/', UserRecipesView.as_view(), name='user_recipes'),
-    path('user/ingredients/', UserIngredientsView.as_view(), name='user_ingredients'),
+    route('user/recipes/', 'user_recipes', 'user', '/api/collections/recipes/', methods=['GET', 'POST', 'DELETE'], auth='required', raise_errors=True),
+    route('user/ingredients/', 'user_ingredients', 'user', '/api/collections/ingredients/', methods=['GET', 'POST', 'DELETE'], auth='required', raise_errors=True),
 
     # Update User Recipes and Ingredients
-    path('user/recipes/update/', UpdateUserRecipesView.as_view(), name='update_user_recipes'),
-    path('user/ingredients/update/', UpdateUserIngredientsView.as_view(), name='update_user_ingredients'),
-    
-]
\ No newline at end of file
+    route('user/recipes/update/', 'update_user_recipes', 'user', '/api/collections/recipes/update/', auth='required', raise_errors=True),
+    route('user/ingredients/update/', 'update_user_ingredients', 'user', '/api/collections/ingredients/update/', auth='required', raise_errors=True),
+
+    # User Recipes and Ingredients in one request
+    fan_out('user/collections/', 'user_collections', [('user', '/api/collections/recipes/'), ('user', '/api/collections/ingredients/')], auth='required'),
+
+    # Gateway Metrics
+    path('metrics/upstream/', UpstreamMetricsView.as_view(), name='upstream_metrics'),
+]
@@ -0,0 +1,5 @@
+# Import the Celery app
+from __future__ import absolute_import, unicode_literals
+from .celery_config import app as celery_app
+
+__all__ = ('celery_app',)
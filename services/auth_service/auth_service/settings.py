@@ -114,6 +114,24 @@ DATABASES = {
     }
 }
 
+# Refresh-token blacklist cache, Redis database 3
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        "LOCATION": "redis://redis:6379/3",
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        }
+    }
+}
+
+# Celery Configuration, on its own database so user_service workers never see these tasks
+CELERY_BROKER_URL = 'redis://redis:6379/4'
+CELERY_RESULT_BACKEND = 'redis://redis:6379/4'
+
+# Expired outstanding tokens deleted per statement by purge_expired_tokens
+TOKEN_PURGE_BATCH_SIZE = env.int('TOKEN_PURGE_BATCH_SIZE', default=1000)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -133,6 +151,24 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing: the preferred hasher hashes new passwords, the others still verify old hashes
+# Shared by auth_service and user_service, keep both in sync
+PASSWORD_HASHER = env.str('PASSWORD_HASHER', default='argon2')
+ARGON2_TIME_COST = env.int('ARGON2_TIME_COST', default=2)
+ARGON2_MEMORY_COST = env.int('ARGON2_MEMORY_COST', default=19456)  # KiB
+ARGON2_PARALLELISM = env.int('ARGON2_PARALLELISM', default=1)
+BCRYPT_ROUNDS = env.int('BCRYPT_ROUNDS', default=10)
+PBKDF2_ITERATIONS = env.int('PBKDF2_ITERATIONS', default=1000000)
+
+PASSWORD_HASHER_CLASSES = {
+    'argon2': 'core.hashers.Argon2PasswordHasher',
+    'bcrypt': 'core.hashers.BCryptSHA256PasswordHasher',
+    'pbkdf2': 'core.hashers.PBKDF2PasswordHasher',
+}
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    hasher for name, hasher in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+
 # JWT settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),  # Expiration time for access tokens
@@ -212,7 +248,13 @@ LOGGING = {
             'class': 'auth_service.logging_handler.CustomHTTPHandler',
             'host': env.str('LOGGING_HOST'),
             'url': env.str('LOGGING_ENDPOINT'),
+            'batch_url': env.str('LOGGING_BATCH_ENDPOINT', default='/api/logs/bulk/'),
             'method': 'POST',
+            'batch_size': env.int('LOGGING_BATCH_SIZE', default=100),
+            'flush_interval': env.float('LOGGING_FLUSH_INTERVAL', default=2),
+            'max_queue': env.int('LOGGING_MAX_QUEUE', default=10000),
+            'timeout': env.float('LOGGING_TIMEOUT', default=5),
+            'spill_path': env.str('LOGGING_SPILL_PATH', default=None),
             'formatter': 'custom',
         },
     },
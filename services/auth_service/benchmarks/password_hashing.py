@@ -0,0 +1,100 @@
+"""
+Password hashing benchmark: logins/sec per core for each hasher setting.
+
+A login is one password verification (check_password), registration is one
+hash (make_password). Each setting runs in a single process, so the logins/sec
+column is the per-core capacity; --processes N also reports N cores together.
+
+Run from services/auth_service:
+    python benchmarks/password_hashing.py --duration 3
+    python benchmarks/password_hashing.py --processes 4
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+
+settings.configure(PASSWORD_HASHERS=["django.contrib.auth.hashers.PBKDF2PasswordHasher"])
+django.setup()
+
+from django.contrib.auth import hashers  # noqa: E402
+
+PASSWORD = "correct horse battery staple"
+
+# (label, base hasher, cost attributes), same knobs as core.hashers
+SETTINGS = [
+    ("pbkdf2 iterations=1000000", hashers.PBKDF2PasswordHasher, {"iterations": 1000000}),
+    ("pbkdf2 iterations=600000", hashers.PBKDF2PasswordHasher, {"iterations": 600000}),
+    ("bcrypt rounds=12", hashers.BCryptSHA256PasswordHasher, {"rounds": 12}),
+    ("bcrypt rounds=11", hashers.BCryptSHA256PasswordHasher, {"rounds": 11}),
+    ("bcrypt rounds=10", hashers.BCryptSHA256PasswordHasher, {"rounds": 10}),
+    ("argon2 t=3 m=65536 p=1", hashers.Argon2PasswordHasher, {"time_cost": 3, "memory_cost": 65536, "parallelism": 1}),
+    ("argon2 t=2 m=19456 p=1", hashers.Argon2PasswordHasher, {"time_cost": 2, "memory_cost": 19456, "parallelism": 1}),
+    ("argon2 t=1 m=19456 p=1", hashers.Argon2PasswordHasher, {"time_cost": 1, "memory_cost": 19456, "parallelism": 1}),
+]
+
+
+def build_hasher(index):
+    label, base, costs = SETTINGS[index]
+    return type("BenchmarkHasher", (base,), costs)()
+
+
+# Verifications per second of one hasher setting in this process
+def logins_per_second(index, duration):
+    hasher = build_hasher(index)
+    encoded = hasher.encode(PASSWORD, hasher.salt())
+
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        assert hasher.verify(PASSWORD, encoded)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def hash_ms(index):
+    hasher = build_hasher(index)
+    start = time.perf_counter()
+    hasher.encode(PASSWORD, hasher.salt())
+    return (time.perf_counter() - start) * 1000
+
+
+# argon2-cffi and bcrypt are optional, PBKDF2 is built in
+def available(index):
+    hasher = build_hasher(index)
+    if hasher.library is None:
+        return True
+    try:
+        hasher._load_library()
+        return True
+    except ValueError as e:
+        print(f"Skipping {SETTINGS[index][0]}: {e}")
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=3, help="seconds per setting")
+    parser.add_argument("--processes", type=int, default=1, help="also measure this many cores together")
+    args = parser.parse_args()
+
+    indexes = [index for index in range(len(SETTINGS)) if available(index)]
+    header = f"{'setting':<28}{'hash ms':>10}{'logins/s/core':>16}"
+    if args.processes > 1:
+        header += f"{f'logins/s x{args.processes}':>18}"
+    print(header)
+
+    for index in indexes:
+        row = f"{SETTINGS[index][0]:<28}{hash_ms(index):>10.1f}{logins_per_second(index, args.duration):>16.1f}"
+        if args.processes > 1:
+            with ProcessPoolExecutor(max_workers=args.processes) as executor:
+                total = sum(executor.map(logins_per_second, [index] * args.processes, [args.duration] * args.processes))
+            row += f"{total:>18.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import time
+import logging
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+# Initialize logger
+logger = logging.getLogger('django')
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding tokens (and their blacklist rows) in small chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.TOKEN_PURGE_BATCH_SIZE)
+
+    def handle(self, *args, batch_size, **kwargs):
+        try:
+            now = timezone.now()
+            start = time.monotonic()
+            purged = 0
+
+            # Short deletes by primary key keep row locks brief, BlacklistedToken rows cascade
+            while True:
+                ids = list(
+                    OutstandingToken.objects.filter(expires_at__lte=now).order_by('id').values_list('id', flat=True)[:batch_size]
+                )
+                if not ids:
+                    break
+                OutstandingToken.objects.filter(id__in=ids).delete()
+                purged += len(ids)
+
+            elapsed = time.monotonic() - start
+            logger.info(f"Purged {purged} expired tokens in {elapsed:.1f}s")
+            self.stdout.write(self.style.SUCCESS(f"Successfully purged {purged} expired tokens"))
+
+        # Exception handling
+        except Exception as e:
+            logger.error(f"Error purging expired tokens: {str(e)}")
+            self.stdout.write(self.style.ERROR(f"Error purging expired tokens: {str(e)}"))
@@ -0,0 +1,6 @@
+from celery import shared_task
+from django.core.management import call_command
+
+@shared_task
+def purge_expired_tokens_task():
+    call_command('purge_expired_tokens')
@@ -0,0 +1,71 @@
+import time
+import logging
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+# Cached blacklist state per jti
+BLACKLISTED = 1
+NOT_BLACKLISTED = 0
+
+
+def blacklist_key(jti):
+    return f"auth:blacklist:{jti}"
+
+
+# Entries live exactly as long as the token could still be presented
+def remaining_lifetime(exp):
+    return max(int(exp - time.time()), 1)
+
+
+# A logout overwrites any cached state
+def cache_blacklist_state(jti, exp, state):
+    try:
+        cache.set(blacklist_key(jti), state, timeout=remaining_lifetime(exp))
+    except Exception as e:
+        logger.warning(f"Failed to cache blacklist state of token {jti}: {str(e)}")
+        # Never leave a cached NOT_BLACKLISTED behind for a revoked token
+        try:
+            cache.delete(blacklist_key(jti))
+        except Exception as e:
+            logger.error(f"Failed to clear blacklist state of token {jti}: {str(e)}")
+
+
+# Misses are filled with add(), so a logout that cached BLACKLISTED after our database read wins
+def fill_blacklist_state(jti, exp, state):
+    try:
+        cache.add(blacklist_key(jti), state, timeout=remaining_lifetime(exp))
+    except Exception as e:
+        logger.warning(f"Failed to cache blacklist state of token {jti}: {str(e)}")
+
+
+# Redis answers both ways, the BlacklistedToken table is only read when Redis has no entry
+def is_blacklisted(jti, exp):
+    try:
+        state = cache.get(blacklist_key(jti))
+        if state is not None:
+            return state == BLACKLISTED
+    except Exception as e:
+        logger.warning(f"Blacklist cache unavailable: {str(e)}")
+
+    blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+    fill_blacklist_state(jti, exp, BLACKLISTED if blacklisted else NOT_BLACKLISTED)
+    return blacklisted
+
+
+class RefreshToken(BaseRefreshToken):
+    # simplejwt's RefreshToken with the blacklist check served from Redis
+    def check_blacklist(self):
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM], self.payload["exp"]):
+            raise TokenError("Token is blacklisted")
+
+    # The database row stays the source of truth, Redis is updated right after it
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        cache_blacklist_state(self.payload[api_settings.JTI_CLAIM], self.payload["exp"], BLACKLISTED)
+        return blacklisted
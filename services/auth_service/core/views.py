@@ -2,10 +2,12 @@ import requests
 import logging
 from django.conf import settings
 from django.contrib.auth import authenticate
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
 from django.contrib.auth.models import User
 
+# Refresh tokens with a Redis-backed blacklist check
+from .tokens import RefreshToken
+
 # REST Framework
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -44,20 +46,15 @@ class RegisterView(APIView):
             if response.status_code != 201:
                 return Response(response.json(), status=response.status_code)
 
-            # Retrieve user
-            user = User.objects.filter(username=data["username"]).first()
-            if not user:
-                logger.error(f"User {data['username']} not found for authentication")
-                return Response({"message": "User created but not found"}, status=status.HTTP_404_NOT_FOUND)
-
-            # Authenticate user immediately
-            authenticated_user = authenticate(username=user.username, password=data["password"])
-            if authenticated_user is None:
-                logger.error(f"Authentication failed for {user.username} after creation")
+            # User Service just created and hashed the password, so tokens are issued from the returned id
+            created = response.json()
+            if "id" not in created:
+                logger.error(f"User service did not return an id for {data['username']}")
                 return Response({"message": "User created, but authentication failed"}, status=status.HTTP_400_BAD_REQUEST)
-                
+            user = User(id=created["id"], username=created.get("username", data["username"]))
+
             # Generate JWT tokens
-            refresh = RefreshToken.for_user(authenticated_user)
+            refresh = RefreshToken.for_user(user)
             access_token = str(refresh.access_token)
 
             return Response({
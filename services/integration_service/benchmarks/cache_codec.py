@@ -0,0 +1,128 @@
+"""
+Cache codec benchmark: bytes per entry and encode/decode cost.
+
+Compares the old django_redis default (pickle, uncompressed) with the codecs
+considered for the Spoonacular cache. The payload is a synthetic
+includeNutrition=true recipe unless --payload points at a saved response.
+
+Run from services/integration_service:
+    python benchmarks/cache_codec.py --iterations 2000
+    python benchmarks/cache_codec.py --payload recipe_716429.json
+"""
+
+import argparse
+import json
+import pickle
+import random
+import time
+
+
+# Roughly the shape and size of /recipes/{id}/information?includeNutrition=true
+def synthetic_recipe(seed=0):
+    rng = random.Random(seed)
+    nutrients = [
+        {"name": f"Nutrient {i}", "amount": round(rng.uniform(0, 500), 2), "unit": rng.choice(["g", "mg", "µg", "kcal"]), "percentOfDailyNeeds": round(rng.uniform(0, 100), 2)}
+        for i in range(35)
+    ]
+    ingredients = [
+        {
+            "id": rng.randint(1000, 99999),
+            "aisle": rng.choice(["Produce", "Spices and Seasonings", "Dairy", "Meat"]),
+            "image": f"ingredient-{i}.jpg",
+            "name": f"ingredient {i}",
+            "original": f"{rng.randint(1, 4)} cups of ingredient {i}, chopped",
+            "amount": round(rng.uniform(0.1, 4), 2),
+            "unit": rng.choice(["cups", "tbsp", "g", "oz"]),
+            "measures": {
+                "us": {"amount": 1.0, "unitShort": "cup", "unitLong": "cup"},
+                "metric": {"amount": 236.6, "unitShort": "ml", "unitLong": "milliliters"},
+            },
+            "nutrients": nutrients[:12],
+        }
+        for i in range(14)
+    ]
+    return {
+        "id": 716429,
+        "title": "Pasta with Garlic, Scallions, Cauliflower & Breadcrumbs",
+        "image": "https://img.spoonacular.com/recipes/716429-556x370.jpg",
+        "servings": 2,
+        "readyInMinutes": 45,
+        "summary": " ".join(["A tasty, healthy and budget friendly dish."] * 20),
+        "instructions": " ".join(f"Step {i}: stir and simmer gently." for i in range(30)),
+        "extendedIngredients": ingredients,
+        "nutrition": {
+            "nutrients": nutrients,
+            "ingredients": ingredients,
+            "caloricBreakdown": {"percentProtein": 12.5, "percentFat": 30.1, "percentCarbs": 57.4},
+            "weightPerServing": {"amount": 420, "unit": "g"},
+        },
+    }
+
+
+def codecs():
+    available = {"pickle": (lambda v: pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)}
+
+    try:
+        import orjson
+        available["orjson"] = (orjson.dumps, orjson.loads)
+        try:
+            import pyzstd
+            available["orjson+zstd"] = (lambda v: pyzstd.compress(orjson.dumps(v), 3), lambda b: orjson.loads(pyzstd.decompress(b)))
+        except ImportError:
+            print("pyzstd not installed, skipping orjson+zstd")
+        try:
+            import lz4.frame
+            available["orjson+lz4"] = (lambda v: lz4.frame.compress(orjson.dumps(v)), lambda b: orjson.loads(lz4.frame.decompress(b)))
+        except ImportError:
+            print("lz4 not installed, skipping orjson+lz4")
+    except ImportError:
+        print("orjson not installed, skipping orjson codecs")
+
+    try:
+        import msgpack
+        available["msgpack"] = (msgpack.packb, msgpack.unpackb)
+    except ImportError:
+        print("msgpack not installed, skipping msgpack")
+
+    return available
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--payload", help="JSON file with a real Spoonacular response")
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload) as f:
+            payload = json.load(f)
+    else:
+        # Round-trip through JSON so nothing is shared, like a parsed response.json()
+        payload = json.loads(json.dumps(synthetic_recipe()))
+
+    # Values are stored wrapped with their fetch time, as in spoonacular_cache.store()
+    entry = {"value": payload, "fetched_at": time.time()}
+
+    available = codecs()
+    baseline = None
+    print(f"{'codec':<14}{'bytes':>10}{'vs pickle':>11}{'encode µs':>12}{'decode µs':>12}")
+    for name, (encode, decode) in available.items():
+        encoded = encode(entry)
+        assert decode(encoded)["value"] == payload
+
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            encode(entry)
+        encode_us = (time.perf_counter() - start) / args.iterations * 1e6
+
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            decode(encoded)
+        decode_us = (time.perf_counter() - start) / args.iterations * 1e6
+
+        baseline = baseline or len(encoded)
+        print(f"{name:<14}{len(encoded):>10}{len(encoded) / baseline:>10.0%}{encode_us:>12.1f}{decode_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
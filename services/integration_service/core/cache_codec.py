@@ -0,0 +1,36 @@
+import pickle
+import orjson
+import pyzstd
+from django.conf import settings
+from django_redis.compressors.base import BaseCompressor
+from django_redis.exceptions import CompressorError
+from django_redis.serializers.base import BaseSerializer
+
+# Every pickle protocol django_redis used to write starts with this opcode
+PICKLE_PROTO = b"\x80"
+
+
+class OrjsonSerializer(BaseSerializer):
+    # Compact JSON encoding for cached Spoonacular payloads
+    def dumps(self, value):
+        return orjson.dumps(value)
+
+    def loads(self, value):
+        # Entries written before the codec change are still pickled
+        if value[:1] == PICKLE_PROTO:
+            return pickle.loads(value)
+        return orjson.loads(value)
+
+
+class ZstdCompressor(BaseCompressor):
+    # Compress values above a size threshold, small ones are stored as is
+    def compress(self, value):
+        if len(value) > settings.SPOONACULAR_CACHE_COMPRESS_MIN_LENGTH:
+            return pyzstd.compress(value, settings.SPOONACULAR_CACHE_ZSTD_LEVEL)
+        return value
+
+    def decompress(self, value):
+        try:
+            return pyzstd.decompress(value)
+        except pyzstd.ZstdError as e:
+            raise CompressorError from e
@@ -0,0 +1,22 @@
+import hashlib
+from urllib.parse import urlencode
+from django.conf import settings
+
+# Parameters that never change the response and must stay out of cache keys
+EXCLUDED_PARAMS = frozenset({"apiKey"})
+
+
+# Query parameters in a canonical order, with values normalized to strings
+def canonical_params(params):
+    return urlencode(sorted(
+        (str(name), str(value))
+        for name, value in params.items()
+        if name not in EXCLUDED_PARAMS and value is not None
+    ))
+
+
+# Deterministic cache key: same parameters give the same key in every process
+def make_cache_key(namespace, params, *parts):
+    digest = hashlib.sha256(canonical_params(params).encode("utf-8")).hexdigest()[:32]
+    key_parts = [f"spoonacular:v{settings.SPOONACULAR_CACHE_KEY_VERSION}", namespace, *(str(part) for part in parts), digest]
+    return ":".join(key_parts)
@@ -0,0 +1,61 @@
+import logging
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django_redis import get_redis_connection
+
+# Initialize logger
+logger = logging.getLogger('django')
+
+# Spoonacular cache keys from every key format used so far
+KEY_PATTERNS = [
+    "*:recipe_information_*",
+    "*:ingredient_information_*",
+    "*:search_recipes_*",
+    "*:search_ingredients_*",
+    "*:spoonacular:v*",
+]
+
+
+class Command(BaseCommand):
+    help = "Delete Spoonacular cache entries written under older key versions or codecs"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        try:
+            redis = get_redis_connection("default")
+            current_prefix = f"spoonacular:v{settings.SPOONACULAR_CACHE_KEY_VERSION}:"
+            batch_size = options['batch_size']
+            deleted = 0
+            batch = []
+
+            for pattern in KEY_PATTERNS:
+                for key in redis.scan_iter(match=pattern, count=batch_size):
+                    # Keep current entries and their fill locks
+                    if current_prefix in key.decode():
+                        continue
+                    batch.append(key)
+
+                    if len(batch) >= batch_size:
+                        deleted += self.delete(redis, batch, options['dry_run'])
+                        batch = []
+
+            if batch:
+                deleted += self.delete(redis, batch, options['dry_run'])
+
+            action = "Would delete" if options['dry_run'] else "Deleted"
+            logger.info(f"{action} {deleted} outdated Spoonacular cache keys")
+            self.stdout.write(self.style.SUCCESS(f"{action} {deleted} outdated Spoonacular cache keys"))
+
+        # Exception handling
+        except Exception as e:
+            logger.error(f"Error purging cache keys: {str(e)}")
+            self.stdout.write(self.style.ERROR(f"Error purging cache keys: {str(e)}"))
+
+    # UNLINK frees memory in the background without blocking Redis
+    def delete(self, redis, keys, dry_run):
+        if dry_run:
+            return len(keys)
+        return redis.unlink(*keys)
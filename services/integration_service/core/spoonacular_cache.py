@@ -0,0 +1,359 @@
+import time
+import uuid
+import threading
+import logging
+import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import LockError
+
+# In-process Tier
+from .local_cache import LocalCache
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+# Redis hash holding the cache counters shared by every worker
+STATS_KEY = "spoonacular:cache_stats"
+
+# Channel used to drop entries from every worker's in-process tier
+INVALIDATION_CHANNEL = "spoonacular:invalidate"
+PROCESS_ID = uuid.uuid4().hex
+
+# In-process tier in front of Redis for large, hot entries
+local_cache = LocalCache(settings.SPOONACULAR_LOCAL_CACHE_MAX_BYTES, settings.SPOONACULAR_LOCAL_CACHE_TIMEOUT)
+listener_started = False
+listener_lock = threading.Lock()
+
+# Counters are batched in process and flushed to Redis periodically
+counters = Counter()
+counters_lock = threading.Lock()
+last_flush = time.monotonic()
+
+# Background refreshes for entries inside the soft window
+refresh_executor = ThreadPoolExecutor(max_workers=settings.SPOONACULAR_REFRESH_WORKERS)
+refreshing = set()
+refreshing_lock = threading.Lock()
+
+
+# Increment a shared cache counter
+def record(stat, amount=1):
+    global last_flush
+    with counters_lock:
+        counters[stat] += amount
+        if time.monotonic() - last_flush < settings.SPOONACULAR_STATS_FLUSH_INTERVAL:
+            return
+        pending = dict(counters)
+        counters.clear()
+        last_flush = time.monotonic()
+    flush_stats(pending)
+
+
+def flush_stats(pending):
+    try:
+        pipeline = get_redis_connection("default").pipeline(transaction=False)
+        for stat, amount in pending.items():
+            pipeline.hincrby(STATS_KEY, stat, amount)
+        pipeline.execute()
+    except Exception as e:
+        logger.warning(f"Failed to record cache stats: {str(e)}")
+
+
+# Current value of every cache counter, with per-tier hit ratios
+def cache_stats():
+    with counters_lock:
+        pending = dict(counters)
+        counters.clear()
+    if pending:
+        flush_stats(pending)
+
+    raw = get_redis_connection("default").hgetall(STATS_KEY)
+    stats = {name.decode(): int(value) for name, value in raw.items()}
+    for tier in ("local", "redis"):
+        lookups = stats.get(f"{tier}_hits", 0) + stats.get(f"{tier}_misses", 0)
+        stats[f"{tier}_hit_ratio"] = round(stats.get(f"{tier}_hits", 0) / lookups, 4) if lookups else 0.0
+    stats["local_cache"] = local_cache.stats()
+    return stats
+
+
+# Look up an entry in the in-process tier, then in Redis
+def lookup(cache_key, local):
+    if local:
+        start_invalidation_listener()
+        entry = local_cache.get(cache_key)
+        if entry is not None:
+            record("local_hits")
+            return entry
+        record("local_misses")
+
+    entry = cache.get(cache_key)
+    if entry is None:
+        record("redis_misses")
+        return None
+
+    record("redis_hits")
+    if local:
+        local_cache.set(cache_key, entry)
+    return entry
+
+
+# Entries carry their fetch time so soft and hard TTLs can be checked on read
+def store(cache_key, value, local):
+    entry = {"value": value, "fetched_at": time.time()}
+    cache.set(cache_key, entry, timeout=settings.SPOONACULAR_CACHE_STALE_TIMEOUT)
+
+    # Other workers drop their in-process copy, this one keeps the new entry
+    if local:
+        local_cache.set(cache_key, entry)
+        try:
+            get_redis_connection("default").publish(INVALIDATION_CHANNEL, f"{PROCESS_ID} {cache_key}")
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation for {cache_key}: {str(e)}")
+    return entry
+
+
+# Subscribe once per process to invalidations published by other workers
+def start_invalidation_listener():
+    global listener_started
+    if listener_started:
+        return
+    with listener_lock:
+        if listener_started:
+            return
+        threading.Thread(target=listen_for_invalidations, name="spoonacular-invalidation", daemon=True).start()
+        listener_started = True
+
+
+def listen_for_invalidations():
+    while True:
+        try:
+            pubsub = get_redis_connection("default").pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+
+            # Messages may have been missed while disconnected
+            local_cache.clear()
+
+            for message in pubsub.listen():
+                origin, _, cache_key = message["data"].decode().partition(" ")
+                if origin != PROCESS_ID:
+                    local_cache.delete(cache_key)
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener disconnected: {str(e)}")
+            time.sleep(1)
+
+
+def entry_age(entry):
+    return time.time() - entry["fetched_at"]
+
+
+# Return the cached value for cache_key, refreshing stale entries and fetching misses once per key
+def get_or_fetch(cache_key, fetch, local=False):
+    # Check if response is cached
+    entry = lookup(cache_key, local)
+    if entry is not None:
+        age = entry_age(entry)
+
+        # Fresh: serve as is
+        if age < settings.SPOONACULAR_CACHE_TIMEOUT:
+            logger.info("Returning cached response")
+            record("fresh_hits")
+            return entry["value"]
+
+        # Soft window: serve right away and refresh in the background
+        if age < settings.SPOONACULAR_CACHE_HARD_TIMEOUT:
+            logger.info("Returning cached response and refreshing in the background")
+            record("stale_hits")
+            schedule_refresh(cache_key, fetch, local)
+            return entry["value"]
+
+        record("expired")
+
+    try:
+        return fill(cache_key, fetch, local)
+
+    # Past the hard TTL, stale data is only served when Spoonacular fails
+    except requests.exceptions.RequestException as e:
+        if entry is None:
+            raise
+        logger.warning(f"Serving stale response for {cache_key} after Spoonacular error: {str(e)}")
+        record("stale_served")
+        return entry["value"]
+
+
+# Fetch a missing or expired entry with only one caller per key going upstream
+def fill(cache_key, fetch, local):
+    lock_key = f"{cache_key}:lock"
+    deadline = time.monotonic() + settings.SPOONACULAR_COALESCE_WAIT
+
+    while time.monotonic() < deadline:
+        # The first miss takes the lock and fetches
+        lock = cache.lock(lock_key, timeout=settings.SPOONACULAR_LOCK_TIMEOUT)
+        if lock.acquire(blocking=False):
+            try:
+                # Another caller may have filled the key and released the lock since our miss
+                entry = cache.get(cache_key)
+                if entry is not None and entry_age(entry) < settings.SPOONACULAR_CACHE_HARD_TIMEOUT:
+                    record("coalesced")
+                    return entry["value"]
+
+                entry = store(cache_key, fetch(), local)
+                record("fetches")
+                return entry["value"]
+            finally:
+                release(lock, cache_key)
+
+        # Everyone else waits for the entry to be filled
+        while time.monotonic() < deadline:
+            time.sleep(settings.SPOONACULAR_COALESCE_POLL_INTERVAL)
+            entry = cache.get(cache_key)
+            if entry is not None and entry_age(entry) < settings.SPOONACULAR_CACHE_HARD_TIMEOUT:
+                logger.info("Returning coalesced response")
+                record("coalesced")
+                return entry["value"]
+
+            # The lock holder failed without filling the entry, so try to take over
+            if not cache.has_key(lock_key):
+                break
+
+    # Waited too long, fetch without the lock
+    logger.warning(f"Timed out waiting for cache fill of {cache_key}")
+    record("wait_timeouts")
+    entry = store(cache_key, fetch(), local)
+    record("fetches")
+    return entry["value"]
+
+
+# Look up many keys at once: in-process tier first, then a single MGET to Redis
+def lookup_many(cache_keys, local):
+    entries = {}
+    remaining = []
+    if local:
+        start_invalidation_listener()
+    for cache_key in cache_keys:
+        entry = local_cache.get(cache_key) if local else None
+        if entry is not None:
+            entries[cache_key] = entry
+        else:
+            remaining.append(cache_key)
+
+    if local:
+        record("local_hits", len(entries))
+        record("local_misses", len(remaining))
+
+    found = cache.get_many(remaining) if remaining else {}
+    record("redis_hits", len(found))
+    record("redis_misses", len(remaining) - len(found))
+    for cache_key, entry in found.items():
+        entries[cache_key] = entry
+        if local:
+            local_cache.set(cache_key, entry)
+    return entries
+
+
+# Store many entries with one pipelined write and one pipelined publish
+def store_many(values, local):
+    fetched_at = time.time()
+    entries = {cache_key: {"value": value, "fetched_at": fetched_at} for cache_key, value in values.items()}
+    if not entries:
+        return entries
+    cache.set_many(entries, timeout=settings.SPOONACULAR_CACHE_STALE_TIMEOUT)
+
+    if local:
+        for cache_key, entry in entries.items():
+            local_cache.set(cache_key, entry)
+        try:
+            pipeline = get_redis_connection("default").pipeline(transaction=False)
+            for cache_key in entries:
+                pipeline.publish(INVALIDATION_CHANNEL, f"{PROCESS_ID} {cache_key}")
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidations: {str(e)}")
+    return entries
+
+
+# Batch version of get_or_fetch: keys maps item ids to cache keys, fetch_many(ids) returns {id: value}
+def get_many_or_fetch(keys, fetch_many, local=False):
+    entries = lookup_many(list(keys.values()), local)
+    values = {}
+    stale = {}
+    missing = []
+
+    for item_id, cache_key in keys.items():
+        entry = entries.get(cache_key)
+        if entry is None:
+            missing.append(item_id)
+            continue
+
+        age = entry_age(entry)
+        if age < settings.SPOONACULAR_CACHE_TIMEOUT:
+            record("fresh_hits")
+            values[item_id] = entry["value"]
+        elif age < settings.SPOONACULAR_CACHE_HARD_TIMEOUT:
+            record("stale_hits")
+            values[item_id] = entry["value"]
+            schedule_refresh(cache_key, lambda item_id=item_id: fetch_many([item_id])[item_id], local)
+        else:
+            record("expired")
+            stale[item_id] = entry["value"]
+            missing.append(item_id)
+
+    if not missing:
+        return values
+
+    try:
+        fetched = fetch_many(missing)
+        record("fetches", len(fetched))
+        store_many({keys[item_id]: value for item_id, value in fetched.items()}, local)
+        values.update(fetched)
+
+    # Past the hard TTL, stale data is only served when Spoonacular fails
+    except requests.exceptions.RequestException as e:
+        if len(stale) < len(missing):
+            raise
+        logger.warning(f"Serving {len(stale)} stale responses after Spoonacular error: {str(e)}")
+        record("stale_served", len(stale))
+        values.update(stale)
+
+    return values
+
+
+# Queue a background refresh unless this process is already refreshing the key
+def schedule_refresh(cache_key, fetch, local):
+    with refreshing_lock:
+        if cache_key in refreshing:
+            return
+        refreshing.add(cache_key)
+    refresh_executor.submit(refresh, cache_key, fetch, local)
+
+
+def refresh(cache_key, fetch, local):
+    try:
+        # Skip if another worker already holds the fill lock for this key
+        lock = cache.lock(f"{cache_key}:lock", timeout=settings.SPOONACULAR_LOCK_TIMEOUT)
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            # Already refreshed by a worker that held the lock before us
+            entry = cache.get(cache_key)
+            if entry is not None and entry_age(entry) < settings.SPOONACULAR_CACHE_TIMEOUT:
+                return
+            store(cache_key, fetch(), local)
+            record("refreshes")
+        finally:
+            release(lock, cache_key)
+    except Exception as e:
+        logger.warning(f"Background refresh failed for {cache_key}: {str(e)}")
+        record("refresh_errors")
+    finally:
+        with refreshing_lock:
+            refreshing.discard(cache_key)
+
+
+def release(lock, cache_key):
+    try:
+        lock.release()
+    except LockError:
+        logger.warning(f"Cache lock for {cache_key} expired before the fetch finished")
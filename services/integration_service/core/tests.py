@@ -0,0 +1,36 @@
+import os
+import sys
+import subprocess
+from pathlib import Path
+from django.test import SimpleTestCase
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+
+# Builds the params dict from a set, so its insertion order follows the interpreter's hash seed
+KEY_SCRIPT = (
+    "from django.conf import settings; settings.configure(SPOONACULAR_CACHE_KEY_VERSION=1); "
+    "from core.cache_keys import make_cache_key; "
+    "print(make_cache_key('complex_search', {name: name.upper() for name in "
+    "{'query', 'diet', 'cuisine', 'intolerances', 'number', 'apiKey'}}, 'page', 2))"
+)
+
+
+class CacheKeyTests(SimpleTestCase):
+    def cache_key_with_hash_seed(self, seed):
+        result = subprocess.run(
+            [sys.executable, "-c", KEY_SCRIPT],
+            cwd=SERVICE_DIR,
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+
+    # Every gunicorn worker and container must agree on the key for the same request
+    def test_key_is_the_same_across_hash_seeds(self):
+        first = self.cache_key_with_hash_seed(1)
+        second = self.cache_key_with_hash_seed(2)
+
+        self.assertTrue(first.startswith("spoonacular:v1:complex_search:page:2:"))
+        self.assertEqual(first, second)
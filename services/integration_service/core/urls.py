@@ -1,9 +1,11 @@
 from django.urls import path
-from .views import RecipeInformationView, IngredientInformationView, SearchRecipesView, SearchIngredientsView
+from .views import RecipeInformationView, RecipeInformationBulkView, IngredientInformationView, SearchRecipesView, SearchIngredientsView, CacheStatsView
 
 urlpatterns = [
+    path('recipes/bulk/', RecipeInformationBulkView.as_view(), name='recipe_information_bulk'),
     path('recipes/<int:recipe_id>/', RecipeInformationView.as_view(), name='recipe_information'),
     path('ingredients/<int:ingredient_id>/', IngredientInformationView.as_view(), name='ingredient_information'),
     path('search/recipes/', SearchRecipesView.as_view(), name='search_recipes'),
     path('search/ingredients/', SearchIngredientsView.as_view(), name='search_ingredients'),
+    path('cache/stats/', CacheStatsView.as_view(), name='cache_stats'),
 ]
\ No newline at end of file
@@ -1,13 +1,16 @@
 import requests
 import logging
 from django.conf import settings
-from django.core.cache import cache
 
 # REST Framework
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
 
+# Spoonacular Cache
+from .cache_keys import make_cache_key
+from .spoonacular_cache import get_or_fetch, get_many_or_fetch, cache_stats
+
 # Initialzes Logger
 logger = logging.getLogger('django')
 
@@ -29,26 +32,21 @@ class RecipeInformationView(APIView):
             }
 
             # Generate cache key based on recipe_id and query parameters
-            cache_key = f"recipe_information_{recipe_id}_{hash(frozenset(params.items()))}"
-
-            # Check if response is cached
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                logger.info("Returning cached response")
-                return Response(cached_response, status=status.HTTP_200_OK)
-
-            # Send get request to Spoonacular
-            response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
-            response.raise_for_status()
+            cache_key = make_cache_key("recipe_information", params, recipe_id)
 
-            # Cache the response
-            cache.set(cache_key, response.json(), timeout=settings.SPOONACULAR_CACHE_TIMEOUT)
+            # Send get request to Spoonacular on a cache miss
+            def fetch():
+                response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
+                response.raise_for_status()
+                data = response.json()
 
-            # LOGGER: Test response data
-            logger.info(f"Response from Spoonacular: {response.status_code} - {response.json().get('title')}")
+                # LOGGER: Test response data
+                logger.info(f"Response from Spoonacular: {response.status_code} - {data.get('title')}")
+                return data
 
-            # Return response from Integration service
-            return Response(response.json(), status=response.status_code)
+            # Return cached response, kept in process for hot recipes
+            data = get_or_fetch(cache_key, fetch, local=True)
+            return Response(data, status=status.HTTP_200_OK)
         
         # Exception Handling
         except requests.exceptions.RequestException as e:
@@ -56,6 +54,54 @@ class RecipeInformationView(APIView):
             return Response({"message": str(e)}, status=500)
     
 
+class RecipeInformationBulkView(APIView):
+    def get(self, request):
+        try:
+            # Parse the comma separated ids, dropping duplicates but keeping their order
+            raw_ids = request.query_params.get("ids", "")
+            try:
+                recipe_ids = list(dict.fromkeys(int(recipe_id) for recipe_id in raw_ids.split(",") if recipe_id.strip()))
+            except ValueError:
+                logger.error(f"Invalid recipe ids for bulk information: {raw_ids}")
+                return Response({"message": "ids must be a comma separated list of integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+            if not recipe_ids:
+                return Response({"message": "No recipe ids provided"}, status=status.HTTP_400_BAD_REQUEST)
+            if len(recipe_ids) > settings.SPOONACULAR_BULK_MAX_IDS:
+                return Response({"message": f"At most {settings.SPOONACULAR_BULK_MAX_IDS} recipe ids per request"}, status=status.HTTP_400_BAD_REQUEST)
+
+            # LOGGER: Test received data
+            logger.info(f"Recieving bulk recipe information for {len(recipe_ids)} recipes")
+
+            # Same parameters as RecipeInformationView so both share cache entries
+            params = {
+                "apiKey": SPOONACULAR_API_KEY,
+                "includeNutrition": 'true'
+            }
+            cache_keys = {recipe_id: make_cache_key("recipe_information", params, recipe_id) for recipe_id in recipe_ids}
+
+            # Send one informationBulk request to Spoonacular for all cache misses
+            def fetch_many(missing_ids):
+                url = f"{SPOONACULAR_BASE_URL}/recipes/informationBulk"
+                bulk_params = {**params, "ids": ",".join(str(recipe_id) for recipe_id in missing_ids)}
+                response = requests.get(url, params=bulk_params, headers= {"Content-Type": "application/json"}, timeout=10)
+                response.raise_for_status()
+                recipes = {recipe["id"]: recipe for recipe in response.json()}
+
+                # LOGGER: Test response data
+                logger.info(f"Response from Spoonacular: {response.status_code} - {len(recipes)} of {len(missing_ids)} recipes")
+                return recipes
+
+            # Return recipes in the requested order, skipping ids Spoonacular does not know
+            recipes = get_many_or_fetch(cache_keys, fetch_many, local=True)
+            return Response([recipes[recipe_id] for recipe_id in recipe_ids if recipe_id in recipes], status=status.HTTP_200_OK)
+
+        # Exception Handling
+        except requests.exceptions.RequestException as e:
+            logger.error(f"RequestException: {str(e)}")
+            return Response({"message": str(e)}, status=500)
+
+
 class IngredientInformationView(APIView):
     def get(self, request, ingredient_id):
         try:
@@ -77,26 +123,21 @@ class IngredientInformationView(APIView):
             }
 
             # Generate cache key based on ingredient_id and query parameters
-            cache_key = f"ingredient_information_{ingredient_id}_{hash(frozenset(params.items()))}"
-
-            # Check if response is cached
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                logger.info("Returning cached response")
-                return Response(cached_response, status=status.HTTP_200_OK)
+            cache_key = make_cache_key("ingredient_information", params, ingredient_id)
 
-            # Send get request to Spoonacular
-            response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
-            response.raise_for_status()
+            # Send get request to Spoonacular on a cache miss
+            def fetch():
+                response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
+                response.raise_for_status()
+                data = response.json()
 
-            # Cache the response
-            cache.set(cache_key, response.json(), timeout=settings.SPOONACULAR_CACHE_TIMEOUT)
+                # LOGGER: Test response data
+                logger.info(f"Response from Spoonacular: {response.status_code} - {data.get('name')}")
+                return data
 
-            # LOGGER: Test response data
-            logger.info(f"Response from Spoonacular: {response.status_code} - {response.json().get('name')}")
-
-            # Return response from Integration service
-            return Response(response.json(), status=response.status_code)
+            # Return cached response, coalescing concurrent misses into one Spoonacular call
+            data = get_or_fetch(cache_key, fetch, local=True)
+            return Response(data, status=status.HTTP_200_OK)
         
         # Exception Handling
         except requests.exceptions.RequestException as e:
@@ -147,28 +188,25 @@ class SearchRecipesView(APIView):
                     params[param] = value
                     
             # Generate cache key based on query parameters
-            cache_key = f"search_recipes_{hash(frozenset(params.items()))}"
-
-            # Check if response is cached
-            if params.get("sort") != "random":
-                cached_response = cache.get(cache_key)
-                if cached_response:
-                    logger.info("Returning cached response")
-                    return Response(cached_response, status=status.HTTP_200_OK)
+            cache_key = make_cache_key("search_recipes", params)
 
-            # Send get request to Spoonacular
-            response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
-            response.raise_for_status()
+            # Send get request to Spoonacular on a cache miss
+            def fetch():
+                response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
+                response.raise_for_status()
+                data = response.json()
 
-            # Cache the response
-            if params.get("sort") != "random":
-                cache.set(cache_key, response.json(), timeout=settings.SPOONACULAR_CACHE_TIMEOUT)
+                # LOGGER: Test response data
+                logger.info(f"Response from Spoonacular: {response.status_code} - {data.get('totalResults')} results")
+                return data
 
-            # LOGGER: Test response data
-            logger.info(f"Response from Spoonacular: {response.status_code} - {response.json().get('totalResults')} results")
+            # Random results are never cached
+            if params.get("sort") == "random":
+                return Response(fetch(), status=status.HTTP_200_OK)
 
-            # Return response from Integration service
-            return Response(response.json(), status=response.status_code)
+            # Return cached response, coalescing concurrent misses into one Spoonacular call
+            data = get_or_fetch(cache_key, fetch)
+            return Response(data, status=status.HTTP_200_OK)
         
         # Exception Handling
         except requests.exceptions.RequestException as e:
@@ -206,29 +244,35 @@ class SearchIngredientsView(APIView):
                 params['query'] = 'a'
                 
             # Generate cache key based on query parameters
-            cache_key = f"search_ingredients_{hash(frozenset(params.items()))}"
+            cache_key = make_cache_key("search_ingredients", params)
 
-            # Check if response is cached
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                logger.info("Returning cached response")
-                return Response(cached_response, status=status.HTTP_200_OK)
+            # Send get request to Spoonacular on a cache miss
+            def fetch():
+                response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
+                response.raise_for_status()
+                data = response.json()
 
-            # Send get request to Spoonacular
-            response = requests.get(url, params=params, headers= {"Content-Type": "application/json"}, timeout=10)
-            response.raise_for_status()
+                # LOGGER: Test response data
+                logger.info(f"Response from Spoonacular: {response.status_code} - {data.get('totalResults')} results")
+                return data
 
-            # Cache the response
-            cache.set(cache_key, response.json(), timeout=settings.SPOONACULAR_CACHE_TIMEOUT)
-
-            # LOGGER: Test response data
-            logger.info(f"Response from Spoonacular: {response.status_code} - {response.json().get('totalResults')} results")
-
-            # Return response from Integration service
-            return Response(response.json(), status=response.status_code)
+            # Return cached response, coalescing concurrent misses into one Spoonacular call
+            data = get_or_fetch(cache_key, fetch)
+            return Response(data, status=status.HTTP_200_OK)
         
         # Exception Handling
         except requests.exceptions.RequestException as e:
             logger.error(f"RequestException: {str(e)}")
             return Response({"message": str(e)}, status=500)
 
+
+class CacheStatsView(APIView):
+    def get(self, request):
+        try:
+            # Shared hit / miss / coalesced counters for the Spoonacular cache
+            return Response(cache_stats(), status=status.HTTP_200_OK)
+
+        # Exception Handling
+        except Exception as e:
+            logger.error(f"Error reading cache stats: {str(e)}")
+            return Response({"message": str(e)}, status=500)
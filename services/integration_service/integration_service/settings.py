@@ -99,13 +99,46 @@ CACHES = {
         "LOCATION": "redis://redis:6379/1",
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'SERIALIZER': 'core.cache_codec.OrjsonSerializer',
+            'COMPRESSOR': 'core.cache_codec.ZstdCompressor',
         }
     }
 }
 
-# 1 hour cache timeout
+# Soft TTL: 1 hour, after which entries are served and refreshed in the background
 SPOONACULAR_CACHE_TIMEOUT = 3600
 
+# Hard TTL: 6 hours, after which entries are refetched before being served
+SPOONACULAR_CACHE_HARD_TIMEOUT = 6 * 3600
+
+# Entries stay in Redis for 1 day so they can be served if Spoonacular is down
+SPOONACULAR_CACHE_STALE_TIMEOUT = 24 * 3600
+
+# Threads used for background refreshes
+SPOONACULAR_REFRESH_WORKERS = 4
+
+# Most recipe ids accepted by /api/recipes/bulk/ in one request
+SPOONACULAR_BULK_MAX_IDS = 100
+
+# In-process tier for recipe / ingredient information: 64 MB per worker, 5 minutes
+SPOONACULAR_LOCAL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SPOONACULAR_LOCAL_CACHE_TIMEOUT = 300
+
+# Seconds between flushes of the in-process cache counters to Redis
+SPOONACULAR_STATS_FLUSH_INTERVAL = 10
+
+# Bump to invalidate every cached Spoonacular response at once
+SPOONACULAR_CACHE_KEY_VERSION = 3
+
+# Cached values are orjson encoded and zstd compressed above 1 KB
+SPOONACULAR_CACHE_COMPRESS_MIN_LENGTH = 1024
+SPOONACULAR_CACHE_ZSTD_LEVEL = 3
+
+# Single-flight cache fills: one request per key fetches, the rest wait for it
+SPOONACULAR_LOCK_TIMEOUT = 15
+SPOONACULAR_COALESCE_WAIT = 10
+SPOONACULAR_COALESCE_POLL_INTERVAL = 0.05
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -194,7 +227,13 @@ LOGGING = {
             'class': 'integration_service.logging_handler.CustomHTTPHandler',
             'host': env.str('LOGGING_HOST'),
             'url': env.str('LOGGING_ENDPOINT'),
+            'batch_url': env.str('LOGGING_BATCH_ENDPOINT', default='/api/logs/bulk/'),
             'method': 'POST',
+            'batch_size': env.int('LOGGING_BATCH_SIZE', default=100),
+            'flush_interval': env.float('LOGGING_FLUSH_INTERVAL', default=2),
+            'max_queue': env.int('LOGGING_MAX_QUEUE', default=10000),
+            'timeout': env.float('LOGGING_TIMEOUT', default=5),
+            'spill_path': env.str('LOGGING_SPILL_PATH', default=None),
             'formatter': 'custom',
         },
     },
@@ -0,0 +1,125 @@
+"""
+Log search benchmark: FTS5 sidecar index vs a LIKE scan over the same rows.
+
+Generates --rows synthetic log records spread over --days days, loads them into
+core.search_index.SearchIndex and into a plain SQLite table standing in for Log
+(indexed on timestamp, not message), then reports query latency percentiles for
+a rare token (one recipe id), a common token, a multi-word exception string, and
+the rare token pruned to a single day.
+
+Run from services/logging_service:
+    python benchmarks/log_search.py --rows 2000000 --days 30
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core.search_index import SearchIndex  # noqa: E402
+
+SERVICES = ["API Gateway", "Authentication Service", "User Service", "Search Service", "Integration Service"]
+TEMPLATES = [
+    ("WARNING", "Serving stale response for spoonacular:v3:recipe_information:{id} after Spoonacular error: timed out"),
+    ("ERROR", "RequestException: 404 Client Error: Not Found for url: http://integration_service:8000/api/recipes/{id}/"),
+    ("ERROR", "Unexpected error retrieving recipes for user user{user}: KeyError 'title'"),
+    ("WARNING", "Hydrated {n} of {m} entries before the deadline"),
+    ("ERROR", "Version conflict on recipes for user user{user}: now at version {n}"),
+    ("WARNING", "Cache lock for spoonacular:v3:ingredient_information:{id} expired before the fetch finished"),
+]
+
+
+def synthetic_rows(count, days, seed=0):
+    rng = random.Random(seed)
+    end = datetime.datetime.now(datetime.timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    span = days * 86400
+    for log_id in range(1, count + 1):
+        level, template = rng.choice(TEMPLATES)
+        message = template.format(id=rng.randint(100000, 999999), user=rng.randint(1, 50000), n=rng.randint(1, 40), m=40)
+        timestamp = end - datetime.timedelta(seconds=span * (1 - log_id / count))
+        yield log_id, timestamp, rng.choice(SERVICES), level, message
+
+
+def timed(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1] if len(samples) >= 20 else samples[-1], result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scan-repeat", type=int, default=3, help="repeats for the slow LIKE baseline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = SearchIndex(os.path.join(directory, "index"))
+        scan = sqlite3.connect(os.path.join(directory, "scan.sqlite3"))
+        scan.execute("CREATE TABLE log (id INTEGER PRIMARY KEY, timestamp TEXT, service_name TEXT, log_level TEXT, message TEXT)")
+
+        # Load in ingestion-sized batches
+        start = time.perf_counter()
+        batch = []
+        for row in synthetic_rows(args.rows, args.days):
+            batch.append(row)
+            if len(batch) == 10000:
+                index.add(batch)
+                scan.executemany("INSERT INTO log VALUES (?, ?, ?, ?, ?)", [(r[0], r[1].isoformat(), r[2], r[3], r[4]) for r in batch])
+                batch = []
+        if batch:
+            index.add(batch)
+            scan.executemany("INSERT INTO log VALUES (?, ?, ?, ?, ?)", [(r[0], r[1].isoformat(), r[2], r[3], r[4]) for r in batch])
+        # Same timestamp index as Log, so the baseline can prune by time too
+        scan.execute("CREATE INDEX log_time_idx ON log (timestamp)")
+        scan.commit()
+        load_seconds = time.perf_counter() - start
+        print(f"Loaded {args.rows} rows over {args.days} days in {load_seconds:.1f}s ({args.rows / load_seconds:.0f} rows/s into both stores)")
+
+        # Pick a recipe id that occurs in the data, and the day it occurs on
+        message, timestamp = scan.execute(
+            "SELECT message, timestamp FROM log WHERE message LIKE '%/api/recipes/%' ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        rare_id = message.split("/")[-2]
+        rare_day = datetime.datetime.fromisoformat(timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        queries = [
+            ("rare id", rare_id, {}),
+            ("common word", "deadline", {}),
+            ("exception", "KeyError title", {}),
+            ("rare id, 1 day", rare_id, {"since": rare_day, "until": rare_day + datetime.timedelta(days=1)}),
+        ]
+
+        print(f"{'query':<18}{'fts p50 ms':>12}{'fts p95 ms':>12}{'hits':>6}{'LIKE p50 ms':>14}")
+        for name, text, window in queries:
+            fts_p50, fts_p95, results = timed(lambda: index.search(text, limit=50, **window), args.repeat)
+
+            like = f"%{text.split()[0]}%"
+            sql = "SELECT id FROM log WHERE message LIKE ?"
+            params = [like]
+            if window:
+                sql += " AND timestamp >= ? AND timestamp < ?"
+                params += [window["since"].isoformat(), window["until"].isoformat()]
+            # Newest first, like GET /logs/, so the scan can't stop at the first 50 matches
+            like_p50, _, _ = timed(lambda: scan.execute(sql + " ORDER BY timestamp DESC LIMIT 50", params).fetchall(), args.scan_repeat)
+
+            print(f"{name:<18}{fts_p50:>12.2f}{fts_p95:>12.2f}{len(results):>6}{like_p50:>14.1f}")
+
+        for day in index.days():
+            index.close(day)
+        scan.close()
+
+
+if __name__ == "__main__":
+    main()
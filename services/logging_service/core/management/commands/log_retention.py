@@ -0,0 +1,60 @@
+import time
+import datetime
+import logging
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core.models import Log, LogRollup
+from core.partitions import is_partitioned, create_partitions, drop_partitions
+from core.search import search_index
+
+# Initialize logger
+logger = logging.getLogger('django')
+
+# Midnight UTC at the start of day
+def start_of(day):
+    return datetime.datetime.combine(day, datetime.time.min, tzinfo=datetime.timezone.utc)
+
+class Command(BaseCommand):
+    help = "Create upcoming daily Log partitions and drop the ones past the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.LOG_RETENTION_DAYS, help="Days of logs to keep")
+        parser.add_argument('--premake', type=int, default=settings.LOG_PARTITION_PREMAKE_DAYS, help="Days to partition ahead")
+
+    def handle(self, *args, days, premake, **kwargs):
+        try:
+            today = datetime.datetime.now(datetime.timezone.utc).date()
+            cutoff = today - datetime.timedelta(days=days)
+
+            # Rollups are small and kept longer than the logs themselves
+            rollup_cutoff = today - datetime.timedelta(days=settings.LOG_ROLLUP_RETENTION_DAYS)
+            LogRollup.objects.filter(bucket__lt=start_of(rollup_cutoff)).delete()
+
+            # Search index files are per day, expired days are deleted whole
+            dropped_index = search_index.drop_before(cutoff)
+            if dropped_index:
+                logger.info(f"Log retention: dropped {len(dropped_index)} search index files older than {cutoff}")
+
+            if is_partitioned():
+                created = create_partitions(today + datetime.timedelta(days=premake))
+                dropped = drop_partitions(cutoff)
+                logger.info(f"Log retention: created {created} partitions, dropped {len(dropped)} ({', '.join(dropped) or 'none'})")
+                self.stdout.write(self.style.SUCCESS(f"Created {created} partitions, dropped {len(dropped)} partitions older than {cutoff}"))
+                return
+
+            # Unpartitioned databases (local SQLite) fall back to chunked deletes
+            start = time.monotonic()
+            deleted = 0
+            while True:
+                ids = list(Log.objects.filter(timestamp__lt=start_of(cutoff)).values_list('id', flat=True)[:settings.LOG_RETENTION_DELETE_CHUNK])
+                if not ids:
+                    break
+                deleted += Log.objects.filter(id__in=ids).delete()[0]
+
+            logger.info(f"Log retention: deleted {deleted} rows older than {cutoff} in {time.monotonic() - start:.1f}s")
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} logs older than {cutoff}"))
+
+        # Exception handling
+        except Exception as e:
+            logger.error(f"Error applying log retention: {str(e)}")
+            self.stdout.write(self.style.ERROR(f"Error applying log retention: {str(e)}"))
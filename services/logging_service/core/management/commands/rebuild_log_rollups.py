@@ -0,0 +1,49 @@
+import datetime
+import logging
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+from core.models import Log, LogRollup
+
+# Initialize logger
+logger = logging.getLogger('django')
+
+class Command(BaseCommand):
+    help = "Recompute hourly LogRollup rows from Log, one day at a time (backfill after the rollup table was added)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30, help="Days back from now to rebuild")
+
+    def handle(self, *args, days, **kwargs):
+        try:
+            end = timezone.now().replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1)
+            day_start = end - datetime.timedelta(days=days)
+            rebuilt = 0
+
+            # One GROUP BY per day keeps each scan inside a single partition
+            while day_start < end:
+                day_end = min(day_start + datetime.timedelta(days=1), end)
+                rows = (
+                    Log.objects.filter(timestamp__gte=day_start, timestamp__lt=day_end)
+                    .annotate(bucket=TruncHour('timestamp'))
+                    .values('bucket', 'service_name', 'log_level')
+                    .annotate(total=Count('id'))
+                )
+                with transaction.atomic():
+                    LogRollup.objects.filter(bucket__gte=day_start, bucket__lt=day_end).delete()
+                    LogRollup.objects.bulk_create([
+                        LogRollup(bucket=row['bucket'], service_name=row['service_name'], log_level=row['log_level'], count=row['total'])
+                        for row in rows
+                    ])
+                rebuilt += len(rows)
+                day_start = day_end
+
+            logger.info(f"Rebuilt {rebuilt} log rollups for the last {days} days")
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} log rollups for the last {days} days"))
+
+        # Exception handling
+        except Exception as e:
+            logger.error(f"Error rebuilding log rollups: {str(e)}")
+            self.stdout.write(self.style.ERROR(f"Error rebuilding log rollups: {str(e)}"))
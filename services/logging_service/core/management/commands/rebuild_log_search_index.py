@@ -0,0 +1,50 @@
+import datetime
+import logging
+from django.core.management.base import BaseCommand
+from core.models import Log
+from core.search import search_index
+
+# Initialize logger
+logger = logging.getLogger('django')
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from Log, one UTC day file at a time (backfill, or after losing the index volume)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30, help="Days back from today to rebuild")
+        parser.add_argument('--batch-size', type=int, default=5000, help="Logs read and indexed per batch")
+
+    def handle(self, *args, days, batch_size, **kwargs):
+        try:
+            today = datetime.datetime.now(datetime.timezone.utc).date()
+            indexed = 0
+
+            # Logs ingested into a day while it is rebuilt can be missed, so rebuild today last
+            for offset in range(days, -1, -1):
+                day = today - datetime.timedelta(days=offset)
+                day_start = datetime.datetime.combine(day, datetime.time.min, tzinfo=datetime.timezone.utc)
+                logs = (
+                    Log.objects.filter(timestamp__gte=day_start, timestamp__lt=day_start + datetime.timedelta(days=1))
+                    .values_list('id', 'timestamp', 'service_name', 'log_level', 'message')
+                    .iterator(chunk_size=batch_size)
+                )
+
+                search_index.clear(day)
+                batch = []
+                for row in logs:
+                    batch.append(row)
+                    if len(batch) == batch_size:
+                        search_index.add(batch)
+                        indexed += len(batch)
+                        batch = []
+                if batch:
+                    search_index.add(batch)
+                    indexed += len(batch)
+
+            logger.info(f"Rebuilt the log search index with {indexed} logs for the last {days} days")
+            self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} logs for the last {days} days"))
+
+        # Exception handling
+        except Exception as e:
+            logger.error(f"Error rebuilding the log search index: {str(e)}")
+            self.stdout.write(self.style.ERROR(f"Error rebuilding the log search index: {str(e)}"))
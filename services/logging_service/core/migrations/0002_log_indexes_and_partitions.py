@@ -0,0 +1,56 @@
+import datetime
+from django.db import migrations, models
+
+# Days partitioned ahead of time when the table is first partitioned
+PREMAKE_DAYS = 7
+
+
+# MySQL requires the partitioning column in every unique key, so the primary key becomes (id, timestamp)
+def partition_log_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    # Existing rows stay in one history partition until retention drops it
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    days = [today + datetime.timedelta(days=offset) for offset in range(PREMAKE_DAYS + 1)]
+    partitions = [f"PARTITION p_history VALUES LESS THAN ('{today}')"] + [
+        f"PARTITION p{day:%Y%m%d} VALUES LESS THAN ('{day + datetime.timedelta(days=1)}')" for day in days
+    ] + ["PARTITION p_future VALUES LESS THAN (MAXVALUE)"]
+
+    schema_editor.execute("ALTER TABLE core_log DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)")
+    schema_editor.execute(f"ALTER TABLE core_log PARTITION BY RANGE COLUMNS(timestamp) ({', '.join(partitions)})")
+
+
+def unpartition_log_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    schema_editor.execute("ALTER TABLE core_log REMOVE PARTITIONING")
+    schema_editor.execute("ALTER TABLE core_log DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['service_name', 'log_level', 'timestamp'], name='log_service_level_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['service_name', 'timestamp'], name='log_service_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['log_level', 'timestamp'], name='log_level_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['timestamp'], name='log_time_idx'),
+        ),
+        migrations.RunPython(partition_log_table, unpartition_log_table),
+    ]
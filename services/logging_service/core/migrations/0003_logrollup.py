@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_log_indexes_and_partitions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('service_name', models.CharField(max_length=255)),
+                ('log_level', models.CharField(max_length=50)),
+                ('count', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['service_name', 'log_level', 'bucket'], name='log_rollup_service_idx')],
+                'constraints': [models.UniqueConstraint(fields=('bucket', 'service_name', 'log_level'), name='unique_log_rollup')],
+            },
+        ),
+    ]
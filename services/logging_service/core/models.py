@@ -13,5 +13,37 @@ class Log(models.Model):
     # Timestamp of when the log was created
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # On MySQL the table is also RANGE partitioned by day on timestamp (see core/partitions.py)
+        indexes = [
+            models.Index(fields=["service_name", "log_level", "timestamp"], name="log_service_level_time_idx"),
+            # Service-only queries read newest first; InnoDB appends the (id, timestamp) key for the id tie-break
+            models.Index(fields=["service_name", "timestamp"], name="log_service_time_idx"),
+            models.Index(fields=["log_level", "timestamp"], name="log_level_time_idx"),
+            models.Index(fields=["timestamp"], name="log_time_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.timestamp} - {self.service_name} - {self.log_level}"
+
+class LogRollup(models.Model):
+    # Start of the hour the counted logs were created in
+    bucket = models.DateTimeField()
+
+    # Same dimensions as Log
+    service_name = models.CharField(max_length=255)
+    log_level = models.CharField(max_length=50)
+
+    # Logs created in the bucket, maintained on ingestion
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["bucket", "service_name", "log_level"], name="unique_log_rollup"),
+        ]
+        indexes = [
+            models.Index(fields=["service_name", "log_level", "bucket"], name="log_rollup_service_idx"),
+        ]
+
     def __str__(self):
-        return f"{self.timestamp} - {self.service_name} - {self.log_level}"
\ No newline at end of file
+        return f"{self.bucket} - {self.service_name} - {self.log_level}: {self.count}"
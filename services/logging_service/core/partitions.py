@@ -0,0 +1,73 @@
+import datetime
+import logging
+from django.db import connection
+
+# Initialize Logger
+logger = logging.getLogger('django')
+
+# Log rows are split into one partition per UTC day, newer rows land in the catch-all partition
+TABLE = "core_log"
+FUTURE_PARTITION = "p_future"
+
+
+def partition_name(day):
+    return f"p{day:%Y%m%d}"
+
+
+# Partitioning is MySQL only, other databases keep a plain table
+def is_partitioned():
+    if connection.vendor != "mysql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL",
+            [TABLE],
+        )
+        return cursor.fetchone()[0] > 0
+
+
+# (name, upper bound date) of every partition, oldest first; the catch-all has no bound
+def partitions():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY PARTITION_ORDINAL_POSITION",
+            [TABLE],
+        )
+        rows = cursor.fetchall()
+
+    result = []
+    for name, description in rows:
+        bound = None if description == "MAXVALUE" else datetime.date.fromisoformat(description.strip("'")[:10])
+        result.append((name, bound))
+    return result
+
+
+# Split the catch-all partition so every day up to and including last_day has its own partition
+def create_partitions(last_day):
+    bounded = [bound for _, bound in partitions() if bound is not None]
+    next_day = max(bounded) if bounded else datetime.datetime.now(datetime.timezone.utc).date()
+
+    new = []
+    while next_day <= last_day:
+        new.append(f"PARTITION {partition_name(next_day)} VALUES LESS THAN ('{next_day + datetime.timedelta(days=1)}')")
+        next_day += datetime.timedelta(days=1)
+    if not new:
+        return 0
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {TABLE} REORGANIZE PARTITION {FUTURE_PARTITION} INTO "
+            f"({', '.join(new)}, PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE))"
+        )
+    return len(new)
+
+
+# Drop every partition that only holds rows older than cutoff, a metadata operation rather than row DELETEs
+def drop_partitions(cutoff):
+    expired = [name for name, bound in partitions() if bound is not None and bound <= cutoff]
+    if expired:
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {TABLE} DROP PARTITION {', '.join(expired)}")
+    return expired
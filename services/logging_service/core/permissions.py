@@ -0,0 +1,18 @@
+import hmac
+from django.conf import settings
+from rest_framework import permissions
+
+
+class HasLogReadToken(permissions.BasePermission):
+    # Reading logs needs the shared LOG_READ_TOKEN as "Authorization: Bearer <token>", reads are refused while it is unset
+    # Ingestion (POST) stays open to the backend services
+    message = "A valid log read token is required"
+
+    def has_permission(self, request, view):
+        if request.method not in permissions.SAFE_METHODS:
+            return True
+        if not settings.LOG_READ_TOKEN:
+            return False
+
+        scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+        return scheme == 'Bearer' and hmac.compare_digest(token.encode(), settings.LOG_READ_TOKEN.encode())
@@ -0,0 +1,30 @@
+from collections import Counter
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+# Models
+from .models import LogRollup
+
+
+def bucket_start(timestamp):
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+# Add freshly inserted logs to their hourly rollups, one UPDATE per (bucket, service, level)
+def record_rollups(logs):
+    counts = Counter((bucket_start(log.timestamp), log.service_name, log.log_level) for log in logs)
+    for (bucket, service_name, log_level), amount in counts.items():
+        add_to_rollup(bucket, service_name, log_level, amount)
+
+
+def add_to_rollup(bucket, service_name, log_level, amount):
+    rollup = LogRollup.objects.filter(bucket=bucket, service_name=service_name, log_level=log_level)
+    if rollup.update(count=F('count') + amount):
+        return
+
+    # First log of the bucket; a concurrent insert loses the race and falls back to the update
+    try:
+        with transaction.atomic():
+            LogRollup.objects.create(bucket=bucket, service_name=service_name, log_level=log_level, count=amount)
+    except IntegrityError:
+        rollup.update(count=F('count') + amount)
@@ -0,0 +1,35 @@
+import datetime
+import logging
+from django.conf import settings
+
+# Index
+from .search_index import SearchIndex
+
+# Initialize Logger
+logger = logging.getLogger('django')
+
+search_index = SearchIndex(settings.LOG_SEARCH_INDEX_DIR)
+
+
+# Hand saved logs to the celery worker for indexing, keeping the SQLite write lock off the ingest request
+def index_logs(logs):
+    if not settings.LOG_SEARCH_ENABLED:
+        return
+    from .tasks import index_logs_task
+
+    rows = [(log.id, log.timestamp.isoformat(), log.service_name, log.log_level, log.message) for log in logs]
+    try:
+        index_logs_task.delay(rows)
+    except Exception as e:
+        logger.warning(f"Failed to queue {len(rows)} logs for search indexing: {str(e)}")
+
+
+# Add queued rows to the search index; the index can be rebuilt, so failures are only logged
+def index_rows(rows):
+    try:
+        search_index.add(
+            (log_id, datetime.datetime.fromisoformat(timestamp), service_name, log_level, message)
+            for log_id, timestamp, service_name, log_level, message in rows
+        )
+    except Exception as e:
+        logger.warning(f"Failed to index {len(rows)} logs for search: {str(e)}")
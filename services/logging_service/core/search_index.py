@@ -0,0 +1,170 @@
+import os
+import re
+import sqlite3
+import datetime
+import threading
+
+# Full-text index over log messages kept next to MySQL: one SQLite FTS5 file per UTC day,
+# so a time range only opens the days it covers and retention deletes whole files.
+# Only the standard library is used here so benchmarks can build an index without Django.
+
+FILE_PATTERN = re.compile(r"^logs-(\d{8})\.sqlite3$")
+
+
+# Fixed-width UTC text so timestamps compare correctly as strings
+def utc_text(timestamp):
+    return timestamp.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+# FTS5 query matching every word of the user's text, each word quoted so punctuation is literal
+def match_query(text):
+    words = text.split()
+    if not words:
+        raise ValueError("q must contain at least one word")
+    return " AND ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+
+
+class SearchIndex:
+    def __init__(self, directory):
+        self.directory = directory
+        self.local = threading.local()
+
+    def path(self, day):
+        return os.path.join(self.directory, f"logs-{day:%Y%m%d}.sqlite3")
+
+    # Days with an index file, oldest first
+    def days(self):
+        if not os.path.isdir(self.directory):
+            return []
+        days = []
+        for name in os.listdir(self.directory):
+            match = FILE_PATTERN.match(name)
+            if match:
+                days.append(datetime.datetime.strptime(match.group(1), "%Y%m%d").date())
+        return sorted(days)
+
+    # One connection per thread and day file; WAL lets gunicorn workers read while another writes
+    def connect(self, day, create=False):
+        connections = getattr(self.local, "connections", None)
+        if connections is None:
+            connections = self.local.connections = {}
+
+        path = self.path(day)
+        if day in connections:
+            # Retention in another process may have deleted (or a rebuild recreated) the file,
+            # drop the cached connection so the old file's disk space is freed
+            connection, inode = connections[day]
+            if inode == self.inode(path):
+                return connection
+            self.close(day)
+
+        if not create and not os.path.exists(path):
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+
+        connection = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS logs USING fts5("
+            "message, service_name UNINDEXED, log_level UNINDEXED, log_id UNINDEXED, timestamp UNINDEXED)"
+        )
+        connections[day] = (connection, self.inode(path))
+        return connection
+
+    def inode(self, path):
+        try:
+            return os.stat(path).st_ino
+        except FileNotFoundError:
+            return None
+
+    # rows: (log_id, timestamp, service_name, log_level, message) with aware UTC timestamps
+    def add(self, rows):
+        by_day = {}
+        for log_id, timestamp, service_name, log_level, message in rows:
+            timestamp = timestamp.astimezone(datetime.timezone.utc)
+            by_day.setdefault(timestamp.date(), []).append(
+                (message, service_name, log_level, log_id, utc_text(timestamp))
+            )
+
+        for day, entries in by_day.items():
+            connection = self.connect(day, create=True)
+            with connection:
+                connection.executemany(
+                    "INSERT INTO logs (message, service_name, log_level, log_id, timestamp) VALUES (?, ?, ?, ?, ?)",
+                    entries,
+                )
+
+    # Matches within [since, until), newest day first and ranked by BM25 within each day.
+    # BM25 statistics are per file, so scores are only comparable inside one day; days are
+    # read newest first until limit is filled and only the files in the range are opened
+    def search(self, text, since=None, until=None, service_name=None, log_level=None, limit=50):
+        query = match_query(text)
+        conditions = ["logs MATCH ?"]
+        params = [query]
+        if service_name:
+            conditions.append("service_name = ?")
+            params.append(service_name)
+        if log_level:
+            conditions.append("log_level = ?")
+            params.append(log_level)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(utc_text(since))
+        if until:
+            conditions.append("timestamp < ?")
+            params.append(utc_text(until))
+
+        # Lower BM25 is better; ties go to the newest log
+        sql = (
+            "SELECT log_id, timestamp, service_name, log_level, message, snippet(logs, 0, '[', ']', '...', 16), bm25(logs) AS rank "
+            f"FROM logs WHERE {' AND '.join(conditions)} ORDER BY rank, timestamp DESC LIMIT ?"
+        )
+
+        first_day = since.astimezone(datetime.timezone.utc).date() if since else None
+        last_day = until.astimezone(datetime.timezone.utc).date() if until else None
+
+        results = []
+        for day in reversed(self.days()):
+            if len(results) >= limit:
+                break
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            connection = self.connect(day)
+            if connection is None:
+                continue
+            results.extend(connection.execute(sql, params + [limit - len(results)]).fetchall())
+
+        return [
+            {"id": log_id, "timestamp": timestamp, "service_name": service_name, "log_level": log_level,
+             "message": message, "snippet": snippet, "rank": rank}
+            for log_id, timestamp, service_name, log_level, message, snippet, rank in results
+        ]
+
+    # Delete the files of every day before cutoff
+    def drop_before(self, cutoff):
+        dropped = []
+        for day in self.days():
+            if day >= cutoff:
+                break
+            self.close(day)
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.path(day) + suffix)
+                except FileNotFoundError:
+                    pass
+            dropped.append(day)
+        return dropped
+
+    # Drop all rows of one day before a rebuild
+    def clear(self, day):
+        connection = self.connect(day)
+        if connection is not None:
+            with connection:
+                connection.execute("DELETE FROM logs")
+
+    def close(self, day):
+        connections = getattr(self.local, "connections", {})
+        entry = connections.pop(day, None)
+        if entry is not None:
+            entry[0].close()
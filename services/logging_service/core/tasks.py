@@ -0,0 +1,11 @@
+from celery import shared_task
+from django.core.management import call_command
+from .search import index_rows
+
+@shared_task
+def log_retention_task():
+    call_command('log_retention')
+
+@shared_task
+def index_logs_task(rows):
+    index_rows(rows)
@@ -1,6 +1,9 @@
 from django.urls import path
-from .views import LogView
+from .views import LogView, LogBulkView, LogStatsView, LogSearchView
 
 urlpatterns = [
     path('logs/', LogView.as_view(), name='log'),
+    path('logs/bulk/', LogBulkView.as_view(), name='log-bulk'),
+    path('logs/stats/', LogStatsView.as_view(), name='log-stats'),
+    path('logs/search/', LogSearchView.as_view(), name='log-search'),
 ]
\ No newline at end of file
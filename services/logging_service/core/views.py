@@ -1,17 +1,125 @@
+import json
+import base64
+import datetime
 import logging
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q, Sum
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 # REST Framework
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework import status
+from rest_framework import status, serializers
 
 # Models & Serializers
+from .models import Log, LogRollup
 from .serializers import LogSerializer
+from .rollups import record_rollups
+from .search import search_index, index_logs
+from .permissions import HasLogReadToken
 
 # Initialize Logger
 logger = logging.getLogger('django')
 
+# ISO 8601 query parameter as an aware datetime, naive values are taken as UTC
+def parse_time(value, name):
+    if value is None:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"{name} must be an ISO 8601 datetime")
+    return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed, datetime.timezone.utc)
+
+
+# Opaque keyset cursor: the (timestamp, id) of the last log on the previous page
+def encode_cursor(log):
+    return base64.urlsafe_b64encode(f"{log['timestamp'].isoformat()},{log['id']}".encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        timestamp, _, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition(",")
+        return parse_time(timestamp, "cursor"), int(log_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("cursor is invalid")
+
+
+# bulk_create doesn't set primary keys on MySQL; read them back inside the inserting transaction
+# by matching the rows just written, so search results can point at their Log row
+def fill_bulk_ids(logs):
+    pending = {}
+    for log in logs:
+        if log.id is None:
+            pending.setdefault((log.timestamp, log.service_name, log.log_level, log.message), []).append(log)
+    if not pending:
+        return
+
+    timestamps = [key[0] for key in pending]
+    rows = (
+        Log.objects.filter(
+            timestamp__gte=min(timestamps),
+            timestamp__lte=max(timestamps),
+            service_name__in={key[1] for key in pending},
+        )
+        .order_by('id')
+        .values_list('id', 'timestamp', 'service_name', 'log_level', 'message')
+    )
+    for log_id, *key in rows.iterator():
+        matches = pending.get(tuple(key))
+        if matches:
+            matches.pop(0).id = log_id
+
+
+# Filters shared by the query and aggregation endpoints
+def filter_dimensions(queryset, params):
+    if params.get('service'):
+        queryset = queryset.filter(service_name=params['service'])
+    if params.get('level'):
+        queryset = queryset.filter(log_level=params['level'].upper())
+    return queryset
+
+
 class LogView(APIView):
+    permission_classes = [HasLogReadToken]
+
+    # GET Request: newest first, ?service=&level=&since=&until=&limit=&cursor=
+    def get(self, request):
+        try:
+            params = request.query_params
+            logs = filter_dimensions(Log.objects.all(), params)
+
+            since = parse_time(params.get('since'), "since")
+            until = parse_time(params.get('until'), "until")
+            if since:
+                logs = logs.filter(timestamp__gte=since)
+            if until:
+                logs = logs.filter(timestamp__lt=until)
+
+            # Keyset pagination: continue strictly after the cursor, never OFFSET
+            if params.get('cursor'):
+                timestamp, log_id = decode_cursor(params['cursor'])
+                logs = logs.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=log_id))
+
+            limit = min(int(params.get('limit', settings.LOG_QUERY_PAGE_SIZE)), settings.LOG_QUERY_PAGE_MAX)
+            if limit < 1:
+                raise ValueError("limit must be at least 1")
+            page = list(
+                logs.order_by('-timestamp', '-id').values('id', 'service_name', 'log_level', 'message', 'timestamp')[:limit + 1]
+            )
+            next_cursor = encode_cursor(page[limit - 1]) if len(page) > limit else None
+
+            return Response({'logs': page[:limit], 'next': next_cursor}, status=status.HTTP_200_OK)
+
+        # Exception Handling
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Exception occurred: {str(e)}")
+            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     def post(self, request):
         try:
             # Use Log serializer to create Log entry
@@ -19,7 +127,10 @@ class LogView(APIView):
 
             # Validate Log creation
             if serializer.is_valid():
-                serializer.save()
+                with transaction.atomic():
+                    log = serializer.save()
+                    record_rollups([log])
+                    transaction.on_commit(lambda: index_logs([log]))
                 logger.info(f"Log created: {serializer.data['service_name']} - {serializer.data['log_level']}")
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             
@@ -29,4 +140,137 @@ class LogView(APIView):
         # Exception Handling
         except Exception as e:
             logger.error(f"Exception occurred: {str(e)}")
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class LogBulkView(APIView):
+    # Rejected records reported back in the response, the rest are only counted
+    MAX_REPORTED_ERRORS = 100
+
+    def post(self, request):
+        try:
+            records = self.parse(request)
+        except ValueError as e:
+            logger.error(f"Bulk log ingestion failed to parse body: {str(e)}")
+            return Response({'error': f"Invalid body: {str(e)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(records) > settings.LOG_BULK_MAX_RECORDS:
+            return Response({'error': f"At most {settings.LOG_BULK_MAX_RECORDS} records per request"}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        try:
+            # Validate every record with one serializer instance, keeping the valid ones
+            validator = LogSerializer()
+            logs = []
+            errors = []
+            for index, record in enumerate(records):
+                try:
+                    logs.append(Log(**validator.run_validation(record)))
+                except serializers.ValidationError as e:
+                    errors.append({'index': index, 'errors': e.detail})
+
+            # One transaction per request, inserted in chunks
+            with transaction.atomic():
+                Log.objects.bulk_create(logs, batch_size=settings.LOG_BULK_CHUNK_SIZE)
+                if not connection.features.can_return_rows_from_bulk_insert:
+                    fill_bulk_ids(logs)
+                record_rollups(logs)
+                transaction.on_commit(lambda: index_logs(logs))
+
+            logger.info(f"Bulk log ingestion: {len(logs)} accepted, {len(errors)} rejected")
+            return Response({
+                'accepted': len(logs),
+                'rejected': len(errors),
+                'errors': errors[:self.MAX_REPORTED_ERRORS],
+            }, status=status.HTTP_201_CREATED if logs or not errors else status.HTTP_400_BAD_REQUEST)
+
+        # Exception Handling
+        except Exception as e:
+            logger.error(f"Exception occurred: {str(e)}")
+            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    # Records from a JSON array or an NDJSON body (one JSON object per line)
+    def parse(self, request):
+        body = request.body.decode('utf-8')
+        if request.content_type in ('application/x-ndjson', 'application/jsonl'):
+            return [json.loads(line) for line in body.splitlines() if line.strip()]
+
+        records = json.loads(body)
+        if not isinstance(records, list):
+            raise ValueError("expected a JSON array of log records")
+        return records
+
+
+class LogStatsView(APIView):
+    permission_classes = [HasLogReadToken]
+
+    # GET Request: counts per service and level in hour or day buckets, ?service=&level=&since=&until=&interval=
+    def get(self, request):
+        try:
+            params = request.query_params
+            rollups = filter_dimensions(LogRollup.objects.all(), params)
+
+            # Default to the last 24 hours
+            until = parse_time(params.get('until'), "until") or timezone.now()
+            since = parse_time(params.get('since'), "since") or until - datetime.timedelta(days=1)
+            rollups = rollups.filter(bucket__gte=since, bucket__lt=until)
+
+            # Served from the hourly rollup table only, never from Log itself
+            interval = params.get('interval', 'hour')
+            if interval == 'hour':
+                rows = rollups.values('bucket', 'service_name', 'log_level', 'count').order_by('bucket', 'service_name', 'log_level')
+            elif interval == 'day':
+                rows = (
+                    rollups.annotate(day=TruncDay('bucket'))
+                    .values('day', 'service_name', 'log_level')
+                    .annotate(total=Sum('count'))
+                    .order_by('day', 'service_name', 'log_level')
+                )
+                rows = [{'bucket': row['day'], 'service_name': row['service_name'], 'log_level': row['log_level'], 'count': row['total']} for row in rows]
+            else:
+                raise ValueError("interval must be hour or day")
+
+            return Response({'interval': interval, 'since': since, 'until': until, 'buckets': list(rows)}, status=status.HTTP_200_OK)
+
+        # Exception Handling
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Exception occurred: {str(e)}")
+            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class LogSearchView(APIView):
+    permission_classes = [HasLogReadToken]
+
+    # GET Request: logs matching every word of ?q=, newest day first and best match first within a day,
+    # with ?service=&level=&since=&until=&limit=
+    def get(self, request):
+        try:
+            if not settings.LOG_SEARCH_ENABLED:
+                return Response({'error': "Log search is disabled"}, status=status.HTTP_404_NOT_FOUND)
+
+            params = request.query_params
+            text = params.get('q', '')
+            since = parse_time(params.get('since'), "since")
+            until = parse_time(params.get('until'), "until")
+            limit = min(int(params.get('limit', settings.LOG_SEARCH_PAGE_SIZE)), settings.LOG_SEARCH_PAGE_MAX)
+            if limit < 1:
+                raise ValueError("limit must be at least 1")
+
+            # Only the index files of days in [since, until) are opened
+            results = search_index.search(
+                text,
+                since=since,
+                until=until,
+                service_name=params.get('service'),
+                log_level=params['level'].upper() if params.get('level') else None,
+                limit=limit,
+            )
+            return Response({'q': text, 'results': results}, status=status.HTTP_200_OK)
+
+        # Exception Handling
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Exception occurred: {str(e)}")
+            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
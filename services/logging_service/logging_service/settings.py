@@ -187,4 +187,31 @@ AUTH_SERVICE_URL = env.str('AUTH_SERVICE_URL')
 USER_SERVICE_URL = env.str('USER_SERVICE_URL')
 SEARCH_SERVICE_URL = env.str('SEARCH_SERVICE_URL')
 INTEGRATION_SERVICE_URL = env.str('INTEGRATION_SERVICE_URL')
-LOGGING_SERVICE_URL = env.str('LOGGING_SERVICE_URL')
\ No newline at end of file
+LOGGING_SERVICE_URL = env.str('LOGGING_SERVICE_URL')
+
+# Bulk ingestion: records accepted per request and rows per INSERT
+LOG_BULK_MAX_RECORDS = env.int('LOG_BULK_MAX_RECORDS', default=10000)
+LOG_BULK_CHUNK_SIZE = env.int('LOG_BULK_CHUNK_SIZE', default=500)
+
+# Shared token the query, stats and search endpoints require as a Bearer token, reads are refused when unset
+LOG_READ_TOKEN = env.str('LOG_READ_TOKEN', default='')
+
+# Log queries: default and largest page size
+LOG_QUERY_PAGE_SIZE = env.int('LOG_QUERY_PAGE_SIZE', default=100)
+LOG_QUERY_PAGE_MAX = env.int('LOG_QUERY_PAGE_MAX', default=1000)
+
+# Retention: days of logs kept, days partitioned ahead, rows per DELETE on unpartitioned databases
+LOG_RETENTION_DAYS = env.int('LOG_RETENTION_DAYS', default=30)
+LOG_PARTITION_PREMAKE_DAYS = env.int('LOG_PARTITION_PREMAKE_DAYS', default=7)
+LOG_RETENTION_DELETE_CHUNK = env.int('LOG_RETENTION_DELETE_CHUNK', default=1000)
+LOG_ROLLUP_RETENTION_DAYS = env.int('LOG_ROLLUP_RETENTION_DAYS', default=365)
+
+# Full-text search: per-day SQLite FTS5 files kept next to MySQL, and the most results per query
+LOG_SEARCH_ENABLED = env.bool('LOG_SEARCH_ENABLED', default=True)
+LOG_SEARCH_INDEX_DIR = env.str('LOG_SEARCH_INDEX_DIR', default=str(BASE_DIR / 'search_index'))
+LOG_SEARCH_PAGE_SIZE = env.int('LOG_SEARCH_PAGE_SIZE', default=50)
+LOG_SEARCH_PAGE_MAX = env.int('LOG_SEARCH_PAGE_MAX', default=500)
+
+# Celery Configuration, on its own database so other services' workers never see these tasks
+CELERY_BROKER_URL = 'redis://redis:6379/5'
+CELERY_RESULT_BACKEND = 'redis://redis:6379/5'
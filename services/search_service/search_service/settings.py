@@ -182,7 +182,13 @@ LOGGING = {
             'class': 'search_service.logging_handler.CustomHTTPHandler',
             'host': env.str('LOGGING_HOST'),
             'url': env.str('LOGGING_ENDPOINT'),
+            'batch_url': env.str('LOGGING_BATCH_ENDPOINT', default='/api/logs/bulk/'),
             'method': 'POST',
+            'batch_size': env.int('LOGGING_BATCH_SIZE', default=100),
+            'flush_interval': env.float('LOGGING_FLUSH_INTERVAL', default=2),
+            'max_queue': env.int('LOGGING_MAX_QUEUE', default=10000),
+            'timeout': env.float('LOGGING_TIMEOUT', default=5),
+            'spill_path': env.str('LOGGING_SPILL_PATH', default=None),
             'formatter': 'custom',
         },
     },
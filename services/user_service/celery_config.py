@@ -16,9 +16,9 @@ app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
 
 # Celery Beat Schedule
 app.conf.beat_schedule = {
-    # Task to reduce collections every day at midnight
+    # Task to reduce collections every day at midnight, sharded across workers
     'reduce_collections_task': {
-        'task': 'core.tasks.reduce_collections_task',
+        'task': 'core.tasks.reduce_collections_sharded_task',
         'schedule': crontab(hour=0, minute=0),
     },
 }
\ No newline at end of file
@@ -0,0 +1,68 @@
+import hashlib
+import logging
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+# Domain cache marker: no address on the domain can receive mail
+UNDELIVERABLE_DOMAIN = "undeliverable_domain"
+
+
+def email_key(email):
+    return f"hunter:email:{hashlib.sha256(email.strip().lower().encode()).hexdigest()}"
+
+
+def domain_key(domain):
+    return f"hunter:domain:{domain.strip().lower()}"
+
+
+def cache_get(key):
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"Email verification cache unavailable: {str(e)}")
+        return None
+
+
+def cache_set(key, value, timeout):
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception as e:
+        logger.warning(f"Failed to cache email verification: {str(e)}")
+
+
+# Hunter deliverability status of an email ("valid", "invalid", ...), cached per email and per domain
+def verify_email(email):
+    status = cache_get(email_key(email))
+    if status is not None:
+        return status
+
+    domain = email.rpartition("@")[2]
+    if cache_get(domain_key(domain)) == UNDELIVERABLE_DOMAIN:
+        return "invalid"
+
+    response = requests.get(
+        f"{settings.HUNTER_API_URL}",
+        params={"email": email, "api_key": settings.HUNTER_API_KEY},
+        timeout=settings.HUNTER_TIMEOUT
+    )
+    if response.status_code != 200:
+        # Not cached, the next attempt asks Hunter again
+        logger.error(f"Hunter returned {response.status_code} for email verification")
+        return "unknown"
+
+    data = response.json().get("data", {})
+    status = data.get("status", "unknown")
+
+    # Unknown results are retried sooner than definite ones
+    timeout = settings.EMAIL_VERIFICATION_CACHE_TIMEOUT if status != "unknown" else settings.EMAIL_VERIFICATION_UNKNOWN_TIMEOUT
+    cache_set(email_key(email), status, timeout)
+
+    # A domain without mail servers, or a disposable one, rejects every address on it
+    if data.get("mx_records") is False or data.get("disposable"):
+        cache_set(domain_key(domain), UNDELIVERABLE_DOMAIN, settings.EMAIL_DOMAIN_CACHE_TIMEOUT)
+
+    return status
@@ -0,0 +1,83 @@
+import time
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+# Keys of a reduced collection entry (see reduce_collections)
+REDUCED_KEYS = {'id', 'title', 'image'}
+
+# Shared keep-alive session to the integration service
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_maxsize=settings.HYDRATION_POOL_MAXSIZE))
+session.mount("https://", HTTPAdapter(pool_maxsize=settings.HYDRATION_POOL_MAXSIZE))
+
+
+def is_reduced(item):
+    return set(item.keys()) == REDUCED_KEYS
+
+
+# Replace reduced entries with full details, fetching in parallel until the deadline
+def hydrate(items, fetch_batch, batch_size=1):
+    deadline = time.monotonic() + settings.HYDRATION_DEADLINE
+    pending = [item['id'] for item in items if is_reduced(item)]
+    if not pending:
+        return items, False
+
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    executor = ThreadPoolExecutor(max_workers=min(settings.HYDRATION_CONCURRENCY, len(batches)))
+    try:
+        futures = [executor.submit(fetch_batch, batch, deadline) for batch in batches]
+        done, not_done = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+    finally:
+        # Don't wait for stragglers, the partial result is returned now
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    hydrated = {}
+    failed = 0
+    for future in done:
+        try:
+            hydrated.update(future.result())
+        # Any failure (network, non-JSON body, missing "id") only loses its own batch
+        except Exception as e:
+            logger.warning(f"Hydration batch failed: {type(e).__name__}: {str(e)}")
+            failed += 1
+
+    partial = bool(not_done) or failed > 0 or len(hydrated) < len(pending)
+    if partial:
+        logger.warning(f"Hydrated {len(hydrated)} of {len(pending)} entries before the deadline")
+
+    return [hydrated.get(item['id'], item) for item in items], partial
+
+
+# Seconds left before the deadline, used as the timeout of each request
+def remaining(deadline):
+    return max(deadline - time.monotonic(), 0.1)
+
+
+# Fetch full recipe information for a batch of ids with one bulk request
+def fetch_recipes(recipe_ids, deadline):
+    response = session.get(
+        f"{settings.INTEGRATION_SERVICE_URL}/api/recipes/bulk/",
+        params={"ids": ",".join(str(recipe_id) for recipe_id in recipe_ids)},
+        timeout=remaining(deadline),
+    )
+    response.raise_for_status()
+    return {recipe['id']: recipe for recipe in response.json()}
+
+
+# Fetch full ingredient information for a batch of ids, one request each
+def fetch_ingredients(ingredient_ids, deadline):
+    ingredients = {}
+    for ingredient_id in ingredient_ids:
+        response = session.get(
+            f"{settings.INTEGRATION_SERVICE_URL}/api/ingredients/{ingredient_id}/",
+            timeout=remaining(deadline),
+        )
+        response.raise_for_status()
+        ingredients[ingredient_id] = response.json()
+    return ingredients
@@ -1,43 +1,95 @@
+import time
 import logging
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from core.models import UserCollections
+from django.db import transaction
+from django.db.models import Max
+from core.models import CollectionItem, ReductionCheckpoint
+from core.mutations import touch_versions
 
 # Initialize logger
 logger = logging.getLogger('django')
 
+
+# Reduced form of a recipe / ingredient entry
+def reduce(data):
+    return {
+        'id': data.get('id'),
+        'title': data.get('title'),
+        'image': data.get('image')
+    }
+
+
 class Command(BaseCommand):
-    def handle(self, *args, **kwargs):
+    help = "Reduce collection entries to id, title and image in resumable, batched passes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--shard', type=int, default=0, help="Shard handled by this run, 0 to shards - 1")
+        parser.add_argument('--shards', type=int, default=1, help="Number of id ranges the table is split into")
+        parser.add_argument('--batch-size', type=int, default=settings.REDUCE_COLLECTIONS_BATCH_SIZE)
+        parser.add_argument('--restart', action='store_true', help="Ignore the checkpoint and start a new pass")
+
+    def handle(self, *args, shard, shards, batch_size, restart, **kwargs):
         try:
-            collections = UserCollections.objects.all()
-            for collection in collections:
-                # Reduce recipes
-                reduced_recipes = [
-                    {
-                        'id': recipe.get('id'),
-                        'title': recipe.get('title'),
-                        'image': recipe.get('image')
-                    }
-                    for recipe in collection.recipes
-                ]
-                collection.recipes = reduced_recipes
-
-                # Reduce ingredients
-                reduced_ingredients = [
-                    {
-                        'id': ingredient.get('id'),
-                        'title': ingredient.get('title'),
-                        'image': ingredient.get('image')
-                    }
-                    for ingredient in collection.ingredients
-                ]
-                collection.ingredients = reduced_ingredients
-
-                collection.save()
-                logger.info(f"Reduced collections for user {collection.user.username}")
-
-            self.stdout.write(self.style.SUCCESS('Successfully reduced collections for all users'))
+            checkpoint = self.checkpoint(shard, shards, restart)
+            start = time.monotonic()
+            scanned = reduced = 0
+
+            while checkpoint.last_id < checkpoint.end_id:
+                # Keyset chunk of the shard's id range, streamed from the database
+                chunk = (
+                    CollectionItem.objects
+                    .filter(id__gt=checkpoint.last_id, id__lte=checkpoint.end_id)
+                    .order_by('id')
+                    .only('id', 'user_id', 'data')[:batch_size]
+                )
+
+                changed = []
+                last_id = None
+                for item in chunk.iterator(chunk_size=batch_size):
+                    last_id = item.id
+                    scanned += 1
+                    data = reduce(item.data)
+                    if data != item.data:
+                        item.data = data
+                        changed.append(item)
+
+                if last_id is None:
+                    break
+
+                # Write the chunk and move the checkpoint together so a crash never skips rows
+                with transaction.atomic():
+                    if changed:
+                        CollectionItem.objects.bulk_update(changed, ['data'])
+                        touch_versions({item.user_id for item in changed})
+                    checkpoint.last_id = last_id
+                    checkpoint.save(update_fields=['last_id', 'updated_at'])
+
+                reduced += len(changed)
+
+            checkpoint.finished = True
+            checkpoint.save(update_fields=['finished', 'updated_at'])
+
+            elapsed = time.monotonic() - start
+            rate = scanned / elapsed if elapsed else 0
+            logger.info(f"Reduced collections for shard {shard}/{shards}: {reduced} of {scanned} rows changed in {elapsed:.1f}s ({rate:.0f} rows/s)")
+            self.stdout.write(self.style.SUCCESS(f"Successfully reduced collections for shard {shard}/{shards} ({reduced} of {scanned} rows, {rate:.0f} rows/s)"))
 
         # Exception handling
         except Exception as e:
             logger.error(f"Error reducing collections: {str(e)}")
-            self.stdout.write(self.style.ERROR(f"Error reducing collections: {str(e)}"))
\ No newline at end of file
+            self.stdout.write(self.style.ERROR(f"Error reducing collections: {str(e)}"))
+
+    # Resume an unfinished pass, or start a new one over this shard's share of the current id range
+    def checkpoint(self, shard, shards, restart):
+        checkpoint, _ = ReductionCheckpoint.objects.get_or_create(shard=shard, shards=shards)
+        if checkpoint.finished or restart:
+            max_id = CollectionItem.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+            checkpoint.last_id = max_id * shard // shards
+            checkpoint.end_id = max_id * (shard + 1) // shards
+            checkpoint.finished = False
+            checkpoint.save()
+            logger.info(f"Starting reduction of shard {shard}/{shards}: ids {checkpoint.last_id} to {checkpoint.end_id}")
+        else:
+            logger.info(f"Resuming reduction of shard {shard}/{shards} from id {checkpoint.last_id}")
+        return checkpoint
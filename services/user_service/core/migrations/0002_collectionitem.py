@@ -0,0 +1,91 @@
+import json
+import logging
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+# Initialize Logger
+logger = logging.getLogger('django')
+
+
+# Integer id of a JSON collection entry, numeric strings included; None when it has none
+def entry_item_id(entry):
+    item_id = entry.get('id') if isinstance(entry, dict) else None
+    if isinstance(item_id, bool):
+        return None
+    if isinstance(item_id, int):
+        return item_id
+    if isinstance(item_id, str) and item_id.strip().isdigit():
+        return int(item_id)
+    return None
+
+
+# Copy every JSON collection entry into its own CollectionItem row
+# 0003 drops the JSON columns, so entries without a usable id are logged in full before they are lost
+def copy_collections_to_items(apps, schema_editor):
+    UserCollections = apps.get_model('core', 'UserCollections')
+    CollectionItem = apps.get_model('core', 'CollectionItem')
+
+    batch = []
+    copied = 0
+    skipped = 0
+    for collection in UserCollections.objects.all().iterator(chunk_size=BATCH_SIZE):
+        for kind, entries in (('recipe', collection.recipes), ('ingredient', collection.ingredients)):
+            for entry in entries or []:
+                item_id = entry_item_id(entry)
+                if item_id is None:
+                    skipped += 1
+                    logger.warning(f"Skipping {kind} without an integer id for user {collection.user_id}: {json.dumps(entry)}")
+                    continue
+                batch.append(CollectionItem(user_id=collection.user_id, kind=kind, item_id=item_id, data={**entry, 'id': item_id}))
+
+        if len(batch) >= BATCH_SIZE:
+            CollectionItem.objects.bulk_create(batch, ignore_conflicts=True)
+            copied += len(batch)
+            batch = []
+
+    if batch:
+        CollectionItem.objects.bulk_create(batch, ignore_conflicts=True)
+        copied += len(batch)
+
+    logger.info(f"Copied {copied} collection entries to CollectionItem, skipped {skipped} without an integer id")
+
+
+# Rebuild the JSON lists from the CollectionItem rows
+def copy_items_to_collections(apps, schema_editor):
+    UserCollections = apps.get_model('core', 'UserCollections')
+    CollectionItem = apps.get_model('core', 'CollectionItem')
+
+    for collection in UserCollections.objects.all().iterator(chunk_size=BATCH_SIZE):
+        items = CollectionItem.objects.filter(user_id=collection.user_id).order_by('id')
+        collection.recipes = [item.data for item in items if item.kind == 'recipe']
+        collection.ingredients = [item.data for item in items if item.kind == 'ingredient']
+        collection.save(update_fields=['recipes', 'ingredients'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollectionItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('recipe', 'Recipe'), ('ingredient', 'Ingredient')], max_length=20)),
+                ('item_id', models.IntegerField()),
+                ('data', models.JSONField(default=dict)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='collection_items', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'kind', 'id'], name='collection_item_page_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'kind', 'item_id'), name='unique_collection_item')],
+            },
+        ),
+        migrations.RunPython(copy_collections_to_items, copy_items_to_collections),
+    ]
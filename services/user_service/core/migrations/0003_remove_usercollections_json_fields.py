@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_collectionitem'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='usercollections',
+            name='recipes',
+        ),
+        migrations.RemoveField(
+            model_name='usercollections',
+            name='ingredients',
+        ),
+    ]
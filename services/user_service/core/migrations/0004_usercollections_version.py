@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_remove_usercollections_json_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usercollections',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_usercollections_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReductionCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.PositiveIntegerField()),
+                ('shards', models.PositiveIntegerField()),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('end_id', models.BigIntegerField(default=0)),
+                ('finished', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('shard', 'shards'), name='unique_reduction_shard')],
+            },
+        ),
+    ]
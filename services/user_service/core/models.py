@@ -24,11 +24,77 @@ class UserCollections(models.Model):
     # One-to-one relation with a user
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="collections")
 
-    # Stores a list of favorite recipes
-    recipes = models.JSONField(default=list)
+    # Incremented on every change to the user's collection items
+    version = models.PositiveIntegerField(default=0)
 
-    # Stores a list of favorite ingredients
-    ingredients = models.JSONField(default=list)
+    def __str__(self):
+        return f"Collections for {self.user.username}"
+
+
+class CollectionItem(models.Model):
+    RECIPE = "recipe"
+    INGREDIENT = "ingredient"
+
+    # Owner of the collection
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="collection_items")
+
+    # Recipe or ingredient collection
+    kind = models.CharField(max_length=20, choices=[(RECIPE, "Recipe"), (INGREDIENT, "Ingredient")])
+
+    # Spoonacular id of the recipe or ingredient
+    item_id = models.IntegerField()
+
+    # Reduced or full recipe / ingredient details
+    data = models.JSONField(default=dict)
+
+    class Meta:
+        constraints = [
+            # Also the index used for O(1) add / remove lookups
+            models.UniqueConstraint(fields=["user", "kind", "item_id"], name="unique_collection_item"),
+        ]
+        indexes = [
+            # Keyset pagination in insertion order
+            models.Index(fields=["user", "kind", "id"], name="collection_item_page_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.item_id} for {self.user.username}"
+
+
+class EmailVerification(models.Model):
+    PENDING = "pending"
+    VALID = "valid"
+    INVALID = "invalid"
+    UNKNOWN = "unknown"
+
+    # One-to-one relation with a user
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="email_verification")
+
+    # Deliverability of the user's email, pending until the async check ran
+    status = models.CharField(max_length=20, choices=[(PENDING, "Pending"), (VALID, "Valid"), (INVALID, "Invalid"), (UNKNOWN, "Unknown")], default=PENDING)
+    checked_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Email verification for {self.user.username}: {self.status}"
+
+
+class ReductionCheckpoint(models.Model):
+    # Shard of the reduce_collections job this checkpoint belongs to
+    shard = models.PositiveIntegerField()
+    shards = models.PositiveIntegerField()
+
+    # CollectionItem id range of the shard and the last id processed
+    last_id = models.BigIntegerField(default=0)
+    end_id = models.BigIntegerField(default=0)
+
+    # Set once the shard reached end_id, the next run starts a new pass
+    finished = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["shard", "shards"], name="unique_reduction_shard"),
+        ]
 
     def __str__(self):
-        return f"Collections for {self.user.username}"
\ No newline at end of file
+        return f"Reduction shard {self.shard}/{self.shards} at {self.last_id}"
@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.db.models import F
+
+# Models
+from .models import UserCollections, CollectionItem
+
+
+class VersionConflict(Exception):
+    # Raised when a write was based on an older collection version
+    def __init__(self, version):
+        super().__init__(f"Collection is at version {version}")
+        self.version = version
+
+
+# Current collection version for a user, 0 before the first write
+def collection_version(user):
+    return UserCollections.objects.filter(user=user).values_list('version', flat=True).first() or 0
+
+
+# Fail if the client's expected version is not the current one
+def check_version(user, expected_version):
+    version = collection_version(user)
+    if expected_version is not None and expected_version != version:
+        raise VersionConflict(version)
+    return version
+
+
+# Compare-and-set increment: UPDATE ... SET version = version + 1 WHERE version = expected
+def bump_version(user, expected_version=None):
+    for _ in range(2):
+        rows = UserCollections.objects.filter(user=user)
+        if expected_version is not None:
+            rows = rows.filter(version=expected_version)
+        if rows.update(version=F('version') + 1):
+            return collection_version(user)
+
+        # No row matched: create the collection row on first write, otherwise the version moved on
+        _, created = UserCollections.objects.get_or_create(user=user)
+        if not created:
+            break
+    raise VersionConflict(collection_version(user))
+
+
+# Bump the version of collections changed outside a client write (hydration, reduction)
+def touch_versions(user_ids):
+    return UserCollections.objects.filter(user_id__in=user_ids).update(version=F('version') + 1)
+
+
+# Add an item with one indexed insert; the version only moves when the collection changes
+def add_item(user, kind, data, expected_version=None):
+    with transaction.atomic():
+        item, created = CollectionItem.objects.get_or_create(
+            user=user, kind=kind, item_id=data['id'], defaults={'data': data}
+        )
+        version = bump_version(user, expected_version) if created else check_version(user, expected_version)
+    return item, created, version
+
+
+# Remove an item with one indexed delete; a conflicting version rolls the delete back
+def remove_item(user, kind, item_id, expected_version=None):
+    with transaction.atomic():
+        deleted, _ = CollectionItem.objects.filter(user=user, kind=kind, item_id=item_id).delete()
+        version = bump_version(user, expected_version) if deleted else check_version(user, expected_version)
+    return bool(deleted), version
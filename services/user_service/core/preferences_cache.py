@@ -0,0 +1,62 @@
+import logging
+from django.conf import settings
+from django.core.cache import cache
+
+# Models & Serializers
+from .models import UserPreferences
+from .serializers import UserPreferencesSerializer
+
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+
+# Key of a user's serialized preferences, readable by any service on the shared Redis
+def preferences_key(user_id):
+    return f"preferences:v1:{user_id}"
+
+
+# Serialized preferences from the cache, or the database on a miss
+def get_preferences(user):
+    key = preferences_key(user.id)
+    try:
+        data = cache.get(key)
+        if data is not None:
+            return data
+    except Exception as e:
+        logger.warning(f"Preferences cache unavailable: {str(e)}")
+
+    # Read-only query for existing users, defaults are only created on a user's first visit
+    preferences = UserPreferences.objects.filter(user=user).first()
+    if preferences is None:
+        preferences, _ = UserPreferences.objects.get_or_create(user=user)
+        logger.info(f"Created default preferences for user {user.username}")
+
+    # add() only fills a missing key, so a PUT written through since our read is never overwritten
+    data = cacheable(UserPreferencesSerializer(preferences).data)
+    try:
+        cache.add(key, data, timeout=settings.PREFERENCES_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Failed to cache preferences for user {user.username}: {str(e)}")
+    return data
+
+
+# Write-through after an update so every reader sees the new preferences
+def store_preferences(user, data):
+    try:
+        cache.set(preferences_key(user.id), cacheable(data), timeout=settings.PREFERENCES_CACHE_TIMEOUT)
+    except Exception as e:
+        # Don't serve the old entry if the new one could not be written
+        logger.warning(f"Failed to cache preferences for user {user.username}: {str(e)}")
+        invalidate_preferences(user)
+
+
+def invalidate_preferences(user):
+    try:
+        cache.delete(preferences_key(user.id))
+    except Exception as e:
+        logger.warning(f"Failed to invalidate preferences for user {user.username}: {str(e)}")
+
+
+# MultipleChoiceField returns sets, store plain lists
+def cacheable(data):
+    return {key: sorted(value) if isinstance(value, set) else value for key, value in data.items()}
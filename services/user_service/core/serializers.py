@@ -3,13 +3,11 @@ import requests
 from rest_framework import serializers
 from django.conf import settings
 from django.contrib.auth.models import User
-from .models import UserPreferences, UserCollections
+from .models import UserPreferences
+from .email_verification import verify_email
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 
-HUNTER_API_KEY = settings.HUNTER_API_KEY
-HUNTER_API_URL = settings.HUNTER_API_URL
-
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -29,16 +27,13 @@ class UserSerializer(serializers.ModelSerializer):
         except ValidationError:
             raise serializers.ValidationError("Invalid email format.")
         
-        try:
-            response = requests.get(
-                f"{HUNTER_API_URL}",
-                params={"email": value, "api_key": HUNTER_API_KEY},
-                timeout=10
-            )
-            response_data = response.json()
+        # In async mode deliverability is checked after registration by verify_email_task
+        if settings.EMAIL_VERIFICATION_MODE == "async":
+            return value
 
-            # Check if the email is valid
-            if response.status_code != 200 or response_data.get("data", {}).get("status") != "valid":
+        try:
+            # Check if the email is valid (cached per email and per domain)
+            if verify_email(value) != "valid":
                 raise serializers.ValidationError("Invalid email address. Please provide a valid email.")
         except requests.exceptions.RequestException as e:
             raise serializers.ValidationError(f"Error validating email: {str(e)}")
@@ -110,18 +105,3 @@ class UserPreferencesSerializer(serializers.ModelSerializer):
             except ValueError:
                 data["calorie_limit"] = 9999  # Default to 9999 if invalid
         return data
-    
-class UserCollectionsSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = UserCollections
-        fields = ["recipes", "ingredients"]
-
-    # Custom init method to filter fields
-    def __init__(self, *args, **kwargs):
-        fields = kwargs.pop('fields', None)
-        super(UserCollectionsSerializer, self).__init__(*args, **kwargs)
-        if fields is not None:
-            allowed = set(fields)
-            existing = set(self.fields)
-            for field_name in existing - allowed:
-                self.fields.pop(field_name)
@@ -1,6 +1,41 @@
-from celery import shared_task
+import logging
+import requests
+from celery import group, shared_task
+from django.conf import settings
 from django.core.management import call_command
+from django.utils import timezone
+from .models import EmailVerification
+from .email_verification import verify_email
 
+# Initialzes Logger
+logger = logging.getLogger('django')
+
+@shared_task
+def reduce_collections_task(shard=0, shards=1):
+    call_command('reduce_collections', shard=shard, shards=shards)
+
+# Split the nightly reduction into id-range shards picked up by any free worker
 @shared_task
-def reduce_collections_task():
-    call_command('reduce_collections')
\ No newline at end of file
+def reduce_collections_sharded_task(shards=None):
+    shards = shards or settings.REDUCE_COLLECTIONS_SHARDS
+    group(reduce_collections_task.s(shard, shards) for shard in range(shards)).apply_async()
+
+# Check deliverability after an async-mode registration and flag the account with the result
+@shared_task(bind=True, max_retries=5, default_retry_delay=60)
+def verify_email_task(self, user_id):
+    verification = EmailVerification.objects.select_related('user').filter(user_id=user_id).first()
+    if verification is None:
+        return
+
+    try:
+        status = verify_email(verification.user.email)
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Email verification for user {user_id} failed, retrying: {str(e)}")
+        raise self.retry(exc=e)
+
+    if status not in (EmailVerification.VALID, EmailVerification.INVALID):
+        status = EmailVerification.UNKNOWN
+    verification.status = status
+    verification.checked_at = timezone.now()
+    verification.save(update_fields=['status', 'checked_at'])
+    logger.info(f"Email verification for user {verification.user.username}: {status}")
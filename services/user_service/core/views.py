@@ -1,6 +1,6 @@
-import requests
 import logging
 from django.conf import settings
+from django.db import transaction
 
 # REST Framework
 from rest_framework.response import Response
@@ -10,15 +10,20 @@ from rest_framework.exceptions import ParseError
 
 # Models & Serializers
 from django.contrib.auth.models import User
-from .models import UserPreferences, UserCollections
-from .serializers import UserSerializer, UserPreferencesSerializer, UserCollectionsSerializer
+from .models import UserPreferences, CollectionItem, EmailVerification
+from .serializers import UserSerializer, UserPreferencesSerializer
+
+# Email Verification Task
+from .tasks import verify_email_task
+
+# Preferences Cache, Collection Hydration & Mutations
+from .hydration import hydrate, fetch_recipes, fetch_ingredients
+from .preferences_cache import get_preferences, store_preferences
+from .mutations import VersionConflict, collection_version, touch_versions, add_item, remove_item
 
 # Initialzes Logger
 logger = logging.getLogger('django')
 
-# Get Service's URLs in settings.py
-INTEGRATION_SERVICE_URL = settings.INTEGRATION_SERVICE_URL
-
 class UserView(APIView):
     permission_classes = [permissions.AllowAny]
 
@@ -39,7 +44,15 @@ class UserView(APIView):
                 user = serializer.save()
                 logger.info(f"User successfully created")
 
-                return Response({"message": "User created successfully"}, status=status.HTTP_201_CREATED)
+                # Sync mode already checked the email, async mode flags the account once the task ran
+                if settings.EMAIL_VERIFICATION_MODE == "async":
+                    EmailVerification.objects.create(user=user)
+                    transaction.on_commit(lambda: verify_email_task.delay(user.id))
+                else:
+                    EmailVerification.objects.create(user=user, status=EmailVerification.VALID, checked_at=user.date_joined)
+
+                # The id lets auth_service issue tokens without hashing the password again
+                return Response({"message": "User created successfully", "id": user.id, "username": user.username}, status=status.HTTP_201_CREATED)
             
             logger.error(f"User creation failed. Errors: {serializer.errors}")
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -87,14 +100,13 @@ class UserPreferencesView(APIView):
     # GET Request
     def get(self, request):
         try:
-            # Fetch or create default preferences for the authenticated user
-            preferences, created = UserPreferences.objects.get_or_create(user=request.user)
-            serializer = UserPreferencesSerializer(preferences)
+            # Cached preferences, falling back to a read-only query (defaults are created on first visit)
+            data = get_preferences(request.user)
 
             # LOGGER: Test received data
-            logger.info(f"Retrieved preferences for user {request.user.username} (Created: {created})")
+            logger.info(f"Retrieved preferences for user {request.user.username}")
 
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(data, status=status.HTTP_200_OK)
 
         # Exception Handling
         except Exception as e:
@@ -114,6 +126,7 @@ class UserPreferencesView(APIView):
             serializer = UserPreferencesSerializer(preferences, data=request.data, partial=True)
             if serializer.is_valid():
                 serializer.save()
+                store_preferences(request.user, serializer.data)
                 logger.info(f"Updated preferences for user {request.user.username}")
                 return Response(serializer.data, status=status.HTTP_200_OK)
             
@@ -127,240 +140,213 @@ class UserPreferencesView(APIView):
             return Response({"message": "An error occurred while updating preferences."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
 
-class UserRecipesView(APIView):
+class CollectionView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    # Collection settings, set by each subclass
+    kind = None
+    name = None
+    item_name = None
+
+    def items(self, request):
+        return CollectionItem.objects.filter(user=request.user, kind=self.kind)
+
+    # Version the client based its write on, from If-Match (an ETag from GET) or the request body
+    def expected_version(self, request):
+        version = request.headers.get('If-Match') or request.data.get('version')
+        if version is None:
+            return None
+        return int(str(version).removeprefix('W/').strip('"').rpartition('-')[2])
+
+    # Listings change exactly when the version does; the user id keeps ETags apart on shared browsers
+    def etag(self, request, version):
+        return f'W/"{request.user.id}-{version}"'
+
+    # Sparse fieldset: ?fields=id,title,image keeps only those keys (id is always kept)
+    def project(self, request, data):
+        fields = request.query_params.get('fields')
+        if not fields:
+            return data
+        keep = {'id', *(field.strip() for field in fields.split(',') if field.strip())}
+        return [{key: value for key, value in item.items() if key in keep} for item in data]
+
+    def listing(self, request, body, etag):
+        response = Response(body, status=status.HTTP_200_OK)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def conflict(self, request, e):
+        logger.warning(f"Version conflict on {self.name} for user {request.user.username}: now at version {e.version}")
+        return Response({"message": "Collection was modified, reload and retry", "version": e.version}, status=status.HTTP_409_CONFLICT)
+
     # GET Request
     def get(self, request):
         try:
-            # Fetch or create default collections for the authenticated user
-            collections, created = UserCollections.objects.get_or_create(user=request.user)
-            serializer = UserCollectionsSerializer(collections, fields=['recipes'])
+            items = self.items(request).order_by('id')
+
+            # Optional keyset pagination: ?limit=50&after=<next from the previous page>
+            after = request.query_params.get('after')
+            limit = request.query_params.get('limit')
+            if after:
+                items = items.filter(id__gt=int(after))
+
+            # Unchanged since the client's copy: skip loading the items at all
+            version = collection_version(request.user)
+            etag = self.etag(request, version)
+            if etag in request.headers.get('If-None-Match', ''):
+                logger.info(f"{self.name.capitalize()} not modified for user {request.user.username}")
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                response['ETag'] = etag
+                return response
+
+            if not limit:
+                data = list(items.values_list('data', flat=True))
+                logger.info(f"Retrieved {self.name} for user {request.user.username}")
+                return self.listing(request, {self.name: self.project(request, data), "version": version}, etag)
+
+            limit = min(int(limit), settings.COLLECTION_PAGE_MAX)
+            if limit < 1:
+                raise ValueError("limit must be at least 1")
+            page = list(items.values_list('id', 'data')[:limit + 1])
+            next_cursor = page[limit - 1][0] if len(page) > limit else None
 
             # LOGGER: Test received data
-            logger.info(f"Retrieved recipes for user {request.user.username} (Created: {created})")
+            logger.info(f"Retrieved page of {self.name} for user {request.user.username}")
 
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            data = self.project(request, [data for _, data in page[:limit]])
+            return self.listing(request, {self.name: data, "next": next_cursor, "version": version}, etag)
 
         # Exception Handling
+        except ValueError:
+            logger.error(f"Invalid pagination parameters for user {request.user.username}")
+            return Response({"message": "limit and after must be integers"}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            logger.error(f"Unexpected error retrieving recipes for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while retrieving recipes."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            logger.error(f"Unexpected error retrieving {self.name} for user {request.user.username}: {str(e)}")
+            return Response({"message": f"An error occurred while retrieving {self.name}."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     # POST Request
     def post(self, request):
         try:
-            # Fetch or create default collections for the authenticated user
-            collections, _ = UserCollections.objects.get_or_create(user=request.user)
-
             # LOGGER: Test received data
             logger.info(f"Received add request for user {request.user.username}")
 
-            # Add new recipe to collections
-            new_recipe = request.data.get('recipe')
-            if new_recipe:
-                collections.recipes.append(new_recipe)
-                collections.save()
+            # Add new item to collections, a single indexed insert
+            new_item = request.data.get(self.item_name)
+            if not isinstance(new_item, dict) or not isinstance(new_item.get('id'), int):
+                logger.error(f"No {self.item_name} provided in the request for user {request.user.username}")
+                return Response({"message": f"No {self.item_name} provided"}, status=status.HTTP_400_BAD_REQUEST)
 
-                # LOGGER: Updated collections
-                logger.info(f"Added recipe for user {request.user.username}: {new_recipe.get('title')}")
-                return Response({"recipes": collections.recipes}, status=status.HTTP_200_OK)
-            else:
-                logger.error(f"No recipe provided in the request for user {request.user.username}")
-                return Response({"message": "No recipe provided"}, status=status.HTTP_400_BAD_REQUEST)
+            item, created, version = add_item(request.user, self.kind, new_item, self.expected_version(request))
+
+            # LOGGER: Updated collections
+            logger.info(f"Added {self.item_name} for user {request.user.username}: {new_item.get('title') or new_item.get('name')} (Created: {created})")
+            return Response({self.item_name: item.data, "created": created, "version": version}, status=status.HTTP_200_OK)
 
         # Exception Handling
+        except VersionConflict as e:
+            return self.conflict(request, e)
+        except ValueError:
+            logger.error(f"Invalid collection version for user {request.user.username}")
+            return Response({"message": "version must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        except ParseError:
+            logger.error(f"Invalid JSON data received for add {self.item_name}")
+            return Response({"message": "Invalid JSON data"}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            logger.error(f"Unexpected error adding recipe for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while adding recipe."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            logger.error(f"Unexpected error adding {self.item_name} for user {request.user.username}: {str(e)}")
+            return Response({"message": f"An error occurred while adding {self.item_name}."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     # DELETE Request
     def delete(self, request):
         try:
-            # Fetch or create default collections for the authenticated user
-            collections, _ = UserCollections.objects.get_or_create(user=request.user)
-
             # LOGGER: Test received data
             logger.info(f"Received delete request for user {request.user.username}")
 
-            # Remove recipe from collections
-            recipe_to_remove = request.data.get('recipe_id')
-            if recipe_to_remove:
-                if any(recipe.get('id') == recipe_to_remove for recipe in collections.recipes):
-                    collections.recipes = [recipe for recipe in collections.recipes if recipe.get('id') != recipe_to_remove]
-                    collections.save()
+            # Remove item from collections, a single indexed delete
+            item_to_remove = request.data.get(f"{self.item_name}_id")
+            if not item_to_remove:
+                logger.error(f"No {self.item_name} provided in the request for user {request.user.username}")
+                return Response({"message": f"No {self.item_name} provided"}, status=status.HTTP_400_BAD_REQUEST)
 
-                    # LOGGER: Updated collections
-                    logger.info(f"Removed recipe for user {request.user.username}")
-                    return Response({"recipes": collections.recipes}, status=status.HTTP_200_OK)
-                else:
-                    logger.error(f"Recipe with id {recipe_to_remove} not found in collections for user {request.user.username}")
-                    return Response({"message": "Recipe not found"}, status=status.HTTP_404_NOT_FOUND)
-            else:
-                logger.error(f"No recipe provided in the request for user {request.user.username}")
-                return Response({"message": "No recipe provided"}, status=status.HTTP_400_BAD_REQUEST)
+            deleted, version = remove_item(request.user, self.kind, int(item_to_remove), self.expected_version(request))
+            if not deleted:
+                logger.error(f"{self.item_name.capitalize()} with id {item_to_remove} not found in collections for user {request.user.username}")
+                return Response({"message": f"{self.item_name.capitalize()} not found", "version": version}, status=status.HTTP_404_NOT_FOUND)
+
+            # LOGGER: Updated collections
+            logger.info(f"Removed {self.item_name} for user {request.user.username}")
+            return Response({f"{self.item_name}_id": item_to_remove, "version": version}, status=status.HTTP_200_OK)
 
         # Exception Handling
+        except VersionConflict as e:
+            return self.conflict(request, e)
+        except ValueError:
+            logger.error(f"Invalid {self.item_name} id or collection version for user {request.user.username}")
+            return Response({"message": f"{self.item_name}_id and version must be integers"}, status=status.HTTP_400_BAD_REQUEST)
         except ParseError:
             logger.error("Invalid JSON data received for deletion")
             return Response({"message": "Invalid JSON data"}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            logger.error(f"Unexpected error removing recipe for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while removing recipe."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
+            logger.error(f"Unexpected error removing {self.item_name} for user {request.user.username}: {str(e)}")
+            return Response({"message": f"An error occurred while removing {self.item_name}."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class UserIngredientsView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
-
-    # GET Request
-    def get(self, request):
-        try:
-            # Fetch or create default collections for the authenticated user
-            collections, created = UserCollections.objects.get_or_create(user=request.user)
-            serializer = UserCollectionsSerializer(collections, fields=['ingredients'])
 
-            # LOGGER: Test received data
-            logger.info(f"Retrieved ingredients for user {request.user.username} (Created: {created})")
+class UserRecipesView(CollectionView):
+    kind = CollectionItem.RECIPE
+    name = "recipes"
+    item_name = "recipe"
 
-            return Response(serializer.data, status=status.HTTP_200_OK)
 
-        # Exception Handling
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving ingredients for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while retrieving ingredients."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    # POST Request
-    def post(self, request):
-        try:
-            # Fetch or create default collections for the authenticated user
-            collections, _ = UserCollections.objects.get_or_create(user=request.user)
-
-            # LOGGER: Test received data
-            logger.info(f"Received add request for user {request.user.username}")
+class UserIngredientsView(CollectionView):
+    kind = CollectionItem.INGREDIENT
+    name = "ingredients"
+    item_name = "ingredient"
 
-            # Add new ingredient to collections
-            new_ingredient = request.data.get('ingredient')
-            if new_ingredient:
-                collections.ingredients.append(new_ingredient)
-                collections.save()
 
-                # LOGGER: Updated collections
-                logger.info(f"Added ingredient for user {request.user.username}: {new_ingredient.get('name')}")
-                return Response({"ingredients": collections.ingredients}, status=status.HTTP_200_OK)
-            else:
-                logger.error(f"No ingredient provided in the request for user {request.user.username}")
-                return Response({"message": "No ingredient provided"}, status=status.HTTP_400_BAD_REQUEST)
-
-        # Exception Handling
-        except Exception as e:
-            logger.error(f"Unexpected error adding ingredient for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while adding ingredient."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    # DELETE Request
-    def delete(self, request):
-        try:
-            # Fetch or create default collections for the authenticated user
-            collections, _ = UserCollections.objects.get_or_create(user=request.user)
-
-            # LOGGER: Test received data
-            logger.info(f"Received delete request for user {request.user.username}")
-
-            # Remove ingredient from collections
-            ingredient_to_remove = request.data.get('ingredient_id')
-            if ingredient_to_remove:
-                if any(ingredient.get('id') == ingredient_to_remove for ingredient in collections.ingredients):
-                    collections.ingredients = [ingredient for ingredient in collections.ingredients if ingredient.get('id') != ingredient_to_remove]
-                    collections.save()
-
-                    # LOGGER: Updated collections
-                    logger.info(f"Removed ingredient for user {request.user.username}")
-                    return Response({"ingredients": collections.ingredients}, status=status.HTTP_200_OK)
-                else:
-                    logger.error(f"Ingredient with id {ingredient_to_remove} not found in collections for user {request.user.username}")
-                    return Response({"message": "Ingredient not found"}, status=status.HTTP_404_NOT_FOUND)
-            else:
-                logger.error(f"No ingredient provided in the request for user {request.user.username}")
-                return Response({"message": "No ingredient provided"}, status=status.HTTP_400_BAD_REQUEST)
-
-        # Exception Handling
-        except Exception as e:
-            logger.error(f"Unexpected error removing ingredient for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while removing ingredient."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-
-class UpdateRecipesView(APIView):
+class UpdateCollectionView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    # Collection settings, set by each subclass
+    kind = None
+    name = None
+    fetch_batch = None
+    batch_size = 1
+
     def get(self, request):
         try:
-            # Fetch or create default collections for the authenticated user
-            collections, _ = UserCollections.objects.get_or_create(user=request.user)
-            updated_recipes = []
-
-            for recipe in collections.recipes:
-                if set(recipe.keys()) == {'id', 'title', 'image'}:
-                    # Make a GET request to the integrations service to get full recipe information
-                    logger.info(f"Updating recipe for user {request.user.username}")
-                    response = requests.get(f"{INTEGRATION_SERVICE_URL}/api/recipes/{recipe['id']}/")
-                    response.raise_for_status()
-
-                    #LOGGER: Test received data
-                    logger.info(f"Response from Integration service: {response.status_code} - {response.text}")
-
-                    if response.status_code == 200:
-                        full_recipe = response.json()
-                        updated_recipes.append(full_recipe)
-                    else:
-                        updated_recipes.append(recipe)
-                else:
-                    logger.info(f"Recipe appending without update")
-                    updated_recipes.append(recipe)
+            items = list(CollectionItem.objects.filter(user=request.user, kind=self.kind).order_by('id'))
+
+            # Fetch full information for reduced entries in parallel, bounded by a deadline
+            logger.info(f"Updating {self.name} for user {request.user.username}")
+            updated, partial = hydrate([item.data for item in items], self.fetch_batch, batch_size=self.batch_size)
 
-            collections.recipes = updated_recipes
-            collections.save()
+            # Only rows that were hydrated are written back
+            changed = []
+            for item, data in zip(items, updated):
+                if data is not item.data:
+                    item.data = data
+                    changed.append(item)
+            if changed:
+                CollectionItem.objects.bulk_update(changed, ['data'])
+                touch_versions([request.user.id])
 
-            logger.info(f"Updated recipes for user {request.user.username}")
-            return Response({"recipes": collections.recipes}, status=status.HTTP_200_OK)
+            logger.info(f"Updated {self.name} for user {request.user.username} (Partial: {partial})")
+            return Response({self.name: [item.data for item in items], "partial": partial}, status=status.HTTP_200_OK)
 
         # Exception Handling
         except Exception as e:
-            logger.error(f"Unexpected error updating recipes for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while updating recipes."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
+            logger.error(f"Unexpected error updating {self.name} for user {request.user.username}: {str(e)}")
+            return Response({"message": f"An error occurred while updating {self.name}."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class UpdateIngredientsView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
 
-    def get(self, request):
-        try:
-            # Fetch or create default collections for the authenticated user
-            collections, _ = UserCollections.objects.get_or_create(user=request.user)
-            updated_ingredients = []
-
-            for ingredient in collections.ingredients:
-                if set(ingredient.keys()) == {'id', 'title', 'image'}:
-                    # Make a GET request to the integrations service to get full ingredient information
-                    response = requests.get(f"{INTEGRATION_SERVICE_URL}/api/ingredients/{ingredient['id']}/")
-                    response.raise_for_status()
-
-                    #LOGGER: Test received data
-                    logger.info(f"Response from Integration service: {response.status_code} - {response.text}")
-                    
-                    if response.status_code == 200:
-                        full_ingredient = response.json()
-                        updated_ingredients.append(full_ingredient)
-                    else:
-                        updated_ingredients.append(ingredient)
-                else:
-                    updated_ingredients.append(ingredient)
+class UpdateRecipesView(UpdateCollectionView):
+    kind = CollectionItem.RECIPE
+    name = "recipes"
+    fetch_batch = staticmethod(fetch_recipes)
+    batch_size = settings.HYDRATION_BATCH_SIZE
 
-            collections.ingredients = updated_ingredients
-            collections.save()
 
-            logger.info(f"Updated ingredients for user {request.user.username}")
-            return Response({"ingredients": collections.ingredients}, status=status.HTTP_200_OK)
-
-        # Exception Handling
-        except Exception as e:
-            logger.error(f"Unexpected error updating ingredients for user {request.user.username}: {str(e)}")
-            return Response({"message": "An error occurred while updating ingredients."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+class UpdateIngredientsView(UpdateCollectionView):
+    kind = CollectionItem.INGREDIENT
+    name = "ingredients"
+    fetch_batch = staticmethod(fetch_ingredients)
\ No newline at end of file
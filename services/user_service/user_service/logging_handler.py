@@ -1,26 +1,165 @@
+import os
+import sys
+import time
+import queue
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 
 class CustomHTTPHandler(logging.Handler):
     # Initialize the handler with the host, url, and method
-    def __init__(self, host, url, method="POST"):
+    # Records are queued and sent by a background flusher in batches of batch_size or every flush_interval seconds
+    # batch_url, when set, receives a whole batch as one JSON array; otherwise records are sent one by one to url
+    def __init__(self, host, url, method="POST", batch_url=None, batch_size=100, flush_interval=2.0,
+                 max_queue=10000, timeout=5, spill_path=None, report_interval=60):
         super().__init__()
         self.host = host
         self.url = url
         self.method = method
+        self.batch_url = batch_url
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.spill_path = spill_path
+        self.report_interval = report_interval
+        self.max_queue = max_queue
 
-    # Emit the log record to the specified HTTP endpoint
+        self.setup()
+        # Forked workers (gunicorn, celery prefork) start from a clean state instead of the parent's
+        os.register_at_fork(after_in_child=self.setup)
+
+    # Per-process state; a child must not resend the parent's queued records, share its connection
+    # or wait on a lock the parent's flusher held at fork time
+    def setup(self):
+        self.queue = queue.Queue(maxsize=self.max_queue)
+        self.counts = {"sent": 0, "dropped": 0, "failed": 0, "spilled": 0}
+        self.counts_lock = threading.Lock()
+        self.reported = dict(self.counts)
+        self.last_report = time.monotonic()
+
+        # One keep-alive connection to the logging service, used only by the flusher
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self.flusher = None
+        self.flusher_pid = None
+        self.flusher_lock = threading.Lock()
+
+    # Queue the log record; never blocks the request thread
     def emit(self, record):
         try:
             # Format the log record
             log_entry = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        self.start_flusher()
+        try:
+            self.queue.put_nowait(log_entry)
+        except queue.Full:
+            # Backpressure: the logging service is slower than we log
+            self.discard([log_entry], "dropped")
+
+    # Counts of sent, dropped, failed and spilled records, and records still queued
+    def stats(self):
+        with self.counts_lock:
+            counts = dict(self.counts)
+        counts["queued"] = self.queue.qsize()
+        return counts
+
+    # Started lazily so every forked worker (gunicorn, celery) gets its own flusher
+    def start_flusher(self):
+        if self.flusher_pid == os.getpid():
+            return
+        with self.flusher_lock:
+            if self.flusher_pid == os.getpid():
+                return
+            self.flusher = threading.Thread(target=self.run, name="log-flusher", daemon=True)
+            self.flusher.start()
+            self.flusher_pid = os.getpid()
+
+    def run(self):
+        while True:
+            # Wait for the first record, then collect more until the batch is full or old enough
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self.send(batch)
+            self.report()
+
+    def send(self, batch):
+        headers = {'Content-Type': 'application/json'}
+        sent = 0
+        try:
+            if self.batch_url:
+                # Entries are already JSON documents, join them into one array
+                response = self.session.request(
+                    self.method, f"http://{self.host}{self.batch_url}",
+                    data=f"[{','.join(batch)}]", headers=headers, timeout=self.timeout
+                )
+                response.raise_for_status()
+                self.count("sent", len(batch))
+                return
+
+            # POST request to the logging endpoint, one per record
+            for log_entry in batch:
+                response = self.session.request(
+                    self.method, f"http://{self.host}{self.url}",
+                    data=log_entry, headers=headers, timeout=self.timeout
+                )
+                response.raise_for_status()
+                self.count("sent")
+                sent += 1
+        except Exception:
+            self.discard(batch[sent:], "failed")
+
+    # Spill undeliverable records to a local file when configured, otherwise drop them
+    def discard(self, entries, reason):
+        self.count(reason, len(entries))
+        if not self.spill_path:
+            return
+        try:
+            with open(self.spill_path, "a") as spill:
+                spill.write("".join(f"{entry}\n" for entry in entries))
+            self.count("spilled", len(entries))
+        except OSError:
+            pass
+
+    def count(self, name, amount=1):
+        with self.counts_lock:
+            self.counts[name] += amount
 
-            # Prepare the HTTP request
-            headers = {'Content-Type': 'application/json'}
-            url = f"http://{self.host}{self.url}"
+    # Periodically print lost records to stderr, the http handler can't report its own failures
+    def report(self):
+        if time.monotonic() - self.last_report < self.report_interval:
+            return
+        counts = self.stats()
+        lost = {name: counts[name] - self.reported[name] for name in ("dropped", "failed") if counts[name] > self.reported[name]}
+        if lost:
+            print(f"CustomHTTPHandler: {lost} log records not delivered in the last {self.report_interval}s ({counts})", file=sys.stderr)
+        self.reported = {name: counts[name] for name in self.reported}
+        self.last_report = time.monotonic()
 
-            # POST request to the logging endpoint
-            response = requests.post(url, data=log_entry, headers=headers)
-            response.raise_for_status()
-        except Exception as e:
-            self.handleError(record)
\ No newline at end of file
+    # Send what is still queued when logging shuts down
+    def close(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+            if len(batch) == self.batch_size:
+                self.send(batch)
+                batch = []
+        if batch:
+            self.send(batch)
+        super().close()
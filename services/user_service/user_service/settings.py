@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 from datetime import timedelta
+from django.core.exceptions import ImproperlyConfigured
 from .logging_handler import CustomHTTPHandler
 import json
 import environ
@@ -66,6 +67,7 @@ MIDDLEWARE = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'core.authentication.GatewayIdentityAuthentication',
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ],
 }
@@ -113,6 +115,28 @@ DATABASES = {
     }
 }
 
+# Accept the identity header set by the api_gateway after it verified the JWT, only when its HMAC
+# signature checks out with the shared GATEWAY_IDENTITY_SECRET
+TRUST_GATEWAY_IDENTITY = env.bool('TRUST_GATEWAY_IDENTITY', default=False)
+GATEWAY_IDENTITY_HEADER = env.str('GATEWAY_IDENTITY_HEADER', default='X-Gateway-User-Id')
+GATEWAY_IDENTITY_SECRET = env.str('GATEWAY_IDENTITY_SECRET', default='')
+if TRUST_GATEWAY_IDENTITY and not GATEWAY_IDENTITY_SECRET:
+    raise ImproperlyConfigured("TRUST_GATEWAY_IDENTITY requires GATEWAY_IDENTITY_SECRET")
+
+# Shared Redis cache, database 2 (0 is the Celery broker, 1 the integration service cache)
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        "LOCATION": "redis://redis:6379/2",
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        }
+    }
+}
+
+# Cached preferences expire after 1 day, PUT writes them through immediately
+PREFERENCES_CACHE_TIMEOUT = env.int('PREFERENCES_CACHE_TIMEOUT', default=24 * 3600)
+
 # Celery Configuration
 CELERY_BROKER_URL = 'redis://redis:6379/0'
 CELERY_RESULT_BACKEND = 'redis://redis:6379/0'
@@ -136,6 +160,24 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing: the preferred hasher hashes new passwords, the others still verify old hashes
+# Shared by auth_service and user_service, keep both in sync
+PASSWORD_HASHER = env.str('PASSWORD_HASHER', default='argon2')
+ARGON2_TIME_COST = env.int('ARGON2_TIME_COST', default=2)
+ARGON2_MEMORY_COST = env.int('ARGON2_MEMORY_COST', default=19456)  # KiB
+ARGON2_PARALLELISM = env.int('ARGON2_PARALLELISM', default=1)
+BCRYPT_ROUNDS = env.int('BCRYPT_ROUNDS', default=10)
+PBKDF2_ITERATIONS = env.int('PBKDF2_ITERATIONS', default=1000000)
+
+PASSWORD_HASHER_CLASSES = {
+    'argon2': 'core.hashers.Argon2PasswordHasher',
+    'bcrypt': 'core.hashers.BCryptSHA256PasswordHasher',
+    'pbkdf2': 'core.hashers.PBKDF2PasswordHasher',
+}
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    hasher for name, hasher in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+
 # JWT settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),  # Expiration time for access tokens
@@ -215,7 +257,13 @@ LOGGING = {
             'class': 'user_service.logging_handler.CustomHTTPHandler',
             'host': env.str('LOGGING_HOST'),
             'url': env.str('LOGGING_ENDPOINT'),
+            'batch_url': env.str('LOGGING_BATCH_ENDPOINT', default='/api/logs/bulk/'),
             'method': 'POST',
+            'batch_size': env.int('LOGGING_BATCH_SIZE', default=100),
+            'flush_interval': env.float('LOGGING_FLUSH_INTERVAL', default=2),
+            'max_queue': env.int('LOGGING_MAX_QUEUE', default=10000),
+            'timeout': env.float('LOGGING_TIMEOUT', default=5),
+            'spill_path': env.str('LOGGING_SPILL_PATH', default=None),
             'formatter': 'custom',
         },
     },
@@ -240,6 +288,28 @@ SEARCH_SERVICE_URL = env.str('SEARCH_SERVICE_URL')
 INTEGRATION_SERVICE_URL = env.str('INTEGRATION_SERVICE_URL')
 LOGGING_SERVICE_URL = env.str('LOGGING_SERVICE_URL')
 
+# Collection hydration: parallel requests per page load, deadline in seconds, recipes per bulk request
+HYDRATION_CONCURRENCY = env.int('HYDRATION_CONCURRENCY', default=8)
+HYDRATION_DEADLINE = env.float('HYDRATION_DEADLINE', default=8)
+HYDRATION_BATCH_SIZE = env.int('HYDRATION_BATCH_SIZE', default=25)
+HYDRATION_POOL_MAXSIZE = env.int('HYDRATION_POOL_MAXSIZE', default=32)
+
+# Largest page size for collection listings
+COLLECTION_PAGE_MAX = env.int('COLLECTION_PAGE_MAX', default=100)
+
+# Nightly reduction: rows per keyset chunk and id-range shards spread over Celery workers
+REDUCE_COLLECTIONS_BATCH_SIZE = env.int('REDUCE_COLLECTIONS_BATCH_SIZE', default=1000)
+REDUCE_COLLECTIONS_SHARDS = env.int('REDUCE_COLLECTIONS_SHARDS', default=1)
+
 # Hunter API
 HUNTER_API_KEY = env.str('HUNTER_API_KEY')
-HUNTER_API_URL = env.str('HUNTER_API_URL')
\ No newline at end of file
+HUNTER_API_URL = env.str('HUNTER_API_URL')
+HUNTER_TIMEOUT = env.float('HUNTER_TIMEOUT', default=10)
+
+# Email verification: "sync" checks with Hunter during registration, "async" in a Celery task afterwards
+EMAIL_VERIFICATION_MODE = env.str('EMAIL_VERIFICATION_MODE', default='sync')
+
+# Hunter results are cached for 7 days per email (1 hour when unknown), undeliverable domains for 1 day
+EMAIL_VERIFICATION_CACHE_TIMEOUT = env.int('EMAIL_VERIFICATION_CACHE_TIMEOUT', default=7 * 24 * 3600)
+EMAIL_VERIFICATION_UNKNOWN_TIMEOUT = env.int('EMAIL_VERIFICATION_UNKNOWN_TIMEOUT', default=3600)
+EMAIL_DOMAIN_CACHE_TIMEOUT = env.int('EMAIL_DOMAIN_CACHE_TIMEOUT', default=24 * 3600)